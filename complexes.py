@@ -1,8 +1,131 @@
 import networkx as nx
 import numpy as np
-from galois import GF2
-from itertools import combinations
-from metrics import euclidean_metric
+from itertools import chain, combinations
+from math import comb
+from metrics import euclidean_metric, pairwise_metrics
+
+
+def _degeneracy_ordering(neighbors):
+    """
+    Orders vertices of a graph by repeatedly removing a vertex of the lowest degree.
+
+    Arguments
+    ---------
+    neighbors: list of int
+               Neighbourhoods of vertices encoded as bitmasks over integer vertex IDs.
+
+    Returns
+    -------
+    ordering: list of int
+              Vertex IDs in degeneracy order.
+    """
+
+    degrees = [neighborhood.bit_count() for neighborhood in neighbors]
+    buckets = [set() for _ in range(max(degrees, default=0) + 1)]
+    for vertex, degree in enumerate(degrees):
+        buckets[degree].add(vertex)
+
+    remaining = (1 << len(neighbors)) - 1
+    ordering = []
+    lowest = 0
+    for _ in range(len(neighbors)):
+        lowest = max(lowest - 1, 0)
+        while not buckets[lowest]:
+            lowest += 1
+        vertex = buckets[lowest].pop()
+        remaining ^= 1 << vertex
+        ordering.append(vertex)
+        neighbor_bits = neighbors[vertex] & remaining
+        while neighbor_bits:
+            bit = neighbor_bits & -neighbor_bits
+            neighbor = bit.bit_length() - 1
+            buckets[degrees[neighbor]].remove(neighbor)
+            degrees[neighbor] -= 1
+            buckets[degrees[neighbor]].add(neighbor)
+            neighbor_bits ^= bit
+    return ordering
+
+
+def _find_maximal_cliques(neighbors):
+    """
+    Finds all maximal cliques of a graph using Bron-Kerbosch algorithm with Tomita pivoting,
+    outermost level of recursion is processed in degeneracy order. Sets of vertices are
+    bitmasks, so intersections are single AND operations.
+
+    Arguments
+    ---------
+    neighbors: list of int
+               Neighbourhoods of vertices encoded as bitmasks over integer vertex IDs.
+
+    Returns
+    -------
+    cliques: list of list of int
+             Maximal cliques of a graph.
+    """
+
+    cliques = []
+
+    def bron_kerbosch(clique, candidates, excluded):
+        if not candidates and not excluded:
+            cliques.append(clique)
+            return
+
+        pivot, pivot_degree = -1, -1
+        pivot_bits = candidates | excluded
+        while pivot_bits:
+            bit = pivot_bits & -pivot_bits
+            vertex = bit.bit_length() - 1
+            degree = (candidates & neighbors[vertex]).bit_count()
+            if degree > pivot_degree:
+                pivot, pivot_degree = vertex, degree
+            pivot_bits ^= bit
+
+        vertex_bits = candidates & ~neighbors[pivot]
+        while vertex_bits:
+            bit = vertex_bits & -vertex_bits
+            vertex = bit.bit_length() - 1
+            bron_kerbosch(clique + [vertex],
+                          candidates & neighbors[vertex],
+                          excluded & neighbors[vertex])
+            candidates ^= bit
+            excluded |= bit
+            vertex_bits ^= bit
+
+    visited = 0
+    for vertex in _degeneracy_ordering(neighbors):
+        bron_kerbosch([vertex],
+                      neighbors[vertex] & ~visited,
+                      neighbors[vertex] & visited)
+        visited |= 1 << vertex
+    return cliques
+
+
+def _gf2_rank(columns):
+    """
+    Calculates rank of a sparse matrix over Z/2Z by column reduction. Columns are reduced
+    left to right by adding, i.e. XOR-ing, earlier columns with the same lowest nonzero row,
+    so every nonzero reduced column contributes one to the rank.
+
+    Arguments
+    ---------
+    columns: list of int
+             Columns of a matrix encoded as bitmasks over indexes of nonzero rows.
+
+    Returns
+    -------
+    rank: int
+          Rank of a matrix over Z/2Z.
+    """
+
+    pivots = {}
+    for column in columns:
+        while column:
+            low = column.bit_length() - 1
+            if low not in pivots:
+                pivots[low] = column
+                break
+            column ^= pivots[low]
+    return len(pivots)
 
 
 class VietorisRipsComplex:
@@ -23,9 +146,15 @@ class VietorisRipsComplex:
     ----------
     vertex_names: list of str
                   Labels of vertices, if parsed None then indexes of vertices.
+    points: ndarray
+            2D array of coordinates of vertices, i-th row belongs to i-th vertex.
     vertices: dict
               Translation of names of vertices to coordinates of vertices.
+    vertex_ids: dict
+                Translation of names of vertices to contiguous integer IDs.
     radius: float
+    adjacency: list of int
+               Neighbourhoods of vertices encoded as bitmasks over integer vertex IDs.
     graph: Graph
            Graph of a simplicial complex.
     simplices: list of list of str
@@ -51,19 +180,97 @@ class VietorisRipsComplex:
                 Metric used for getting distances between vertices, by default Euclidean metric.
         """
 
-        self.vertex_names = vertex_names or [str(i) for i in range(len(self.vertices))]
+        if vertex_names is None:
+            vertex_names = [str(i) for i in range(len(vertices))]
+        self.vertex_names = list(vertex_names)
+        self.points = np.ascontiguousarray(vertices, dtype=np.float64)
         self.vertices = dict(zip(self.vertex_names, vertices))
-        self.radius = radius
+        self.vertex_ids = {name: i for i, name in enumerate(self.vertex_names)}
         self.metric = metric
+        self._distances = None
+        self.set_radius(radius)
+
+    @property
+    def field(self):
+        """
+        Z/2Z field of coefficients of matrices. galois is imported on first use only,
+        since Betti numbers are calculated without it.
+        """
+
+        from galois import GF2
+        return GF2
+
+    def set_radius(self, radius):
+        """
+        Assigns radius and initiates calculations of a complex. Pairwise distances
+        of vertices do not depend on radius, so they are computed only once and reused
+        by later calls. Caches of the previous radius are replaced, not cleared, so 
+        a shallow copy of a complex can be given a new radius without affecting the original.
+
+        Arguments
+        ---------
+        radius: float
+        """
+
+        self.radius = radius
+        self.adjacency = self.construct_adjacency()
         self.graph = self.construct_graph()
         self.simplices = self.get_simplices()
         self.dim = max(len(simplex) for simplex in self.simplices) - 1
-        self.field = GF2
+        self._p_simplices = {}
+        self._boundary_matrices = {}
+        self._boundary_columns = {}
+        self._masks = {}
+        self._ranks = {}
+        self._betti = None
+
+    def get_distances(self):
+        """
+        Returns pairwise distances of vertices, computed on the first call and cached.
+        Metrics listed in pairwise_metrics are computed by their vectorized pairwise 
+        functions, remaining metrics are called for every pair.
+
+        Returns
+        -------
+        distances: ndarray
+                   2D array of distances.
+        """
+
+        if self._distances is not None:
+            return self._distances
+
+        if self.metric in pairwise_metrics:
+            distances = pairwise_metrics[self.metric](self.points)
+        else:
+            vertices = list(self.vertices.values())
+            distances = np.zeros((len(vertices), len(vertices)))
+            for i, j in combinations(range(len(vertices)), 2):
+                distances[i, j] = distances[j, i] = self.metric(vertices[i], vertices[j])
+
+        self._distances = distances
+        return distances
+
+    def construct_adjacency(self):
+        """
+        Finds pairs of distinct vertices, which distance is smaller than the diameter,
+        ie radius times two. Thresholded rows of distances are packed directly into
+        bitmasks of neighbourhoods. Distances are taken from get_distances.
+
+        Returns
+        -------
+        neighbors: list of int
+                   Neighbourhoods of vertices encoded as bitmasks over integer vertex IDs.
+        """
+
+        adjacency = self.get_distances() <= 2*self.radius
+        np.fill_diagonal(adjacency, False)
+
+        packed = np.packbits(adjacency, axis=1, bitorder='little')
+        return [int.from_bytes(row.tobytes(), 'little') for row in packed]
 
     def construct_graph(self):
         """
-        Contruct a graph of a Vietoris-Rips simplicial complex, adds an edge between two
-        distinct vertices if the distance is smaller than the diameter, ie radius times two.
+        Contruct a graph of a Vietoris-Rips simplicial complex from its adjacency.
 
         Returns
         -------
@@ -73,14 +280,21 @@ class VietorisRipsComplex:
 
         graph = nx.Graph()
         graph.add_nodes_from(self.vertex_names)
-        for i, j in combinations(self.vertex_names, 2):
-            if self.metric(self.vertices[i], self.vertices[j]) <= 2*self.radius:
-                graph.add_edge(i, j)
+
+        edges = []
+        for i, neighborhood in enumerate(self.adjacency):
+            higher_neighbors = neighborhood >> (i + 1)
+            while higher_neighbors:
+                bit = higher_neighbors & -higher_neighbors
+                edges.append((self.vertex_names[i], self.vertex_names[i + bit.bit_length()]))
+                higher_neighbors ^= bit
+        graph.add_edges_from(edges)
         return graph
 
     def get_simplices(self):
         """
         Finds unique simplices of a complex, that are not faces of other simplices.
+        Vertices of every simplex are ordered as in vertex_names.
 
         Returns
         -------
@@ -88,9 +302,9 @@ class VietorisRipsComplex:
                    Unique simplices of a complex, that are not faces of other simplices.
         """
 
-        cliques = list(nx.find_cliques(self.graph))
-        simplices = [list(sorted(clique)) for clique in cliques]
-        return sorted(simplices, key=lambda simplex: (len(simplex), simplex[0]))
+        cliques = [sorted(clique) for clique in _find_maximal_cliques(self.adjacency)]
+        cliques.sort(key=lambda clique: (len(clique), clique))
+        return [[self.vertex_names[i] for i in clique] for clique in cliques]
 
     def get_p_simplices(self, dim):
         """
@@ -107,23 +321,43 @@ class VietorisRipsComplex:
                    All p-simplices of a simplicial complex, i.e. simplices of p-th dimension.
         """
 
-        if dim == 0:
-            return [list(face) for face in self.vertex_names]
-        elif dim < 0 or dim > self.dim:
+        if dim < 0 or dim > self.dim:
             return [[]]
-        else:
-            higher_simplices = [simplex for simplex in self.simplices if len(simplex) >= dim + 1]
-            faces = []
-            for simplex in higher_simplices:
-                for face in combinations(simplex, dim + 1):
-                    faces.append(face)
-            unique_faces = set(tuple(faces))
-            faces = [[vertex for vertex in face] for face in unique_faces]
-            return sorted(faces, key=lambda face: face[0])
+        if not self._p_simplices:
+            self.enumerate_p_simplices()
+        return self._p_simplices[dim]
+
+    def enumerate_p_simplices(self):
+        """
+        Finds p-simplices of a complex for all dimensions p in a single pass over
+        maximal simplices and caches them for get_p_simplices.
+        """
+
+        simplex_ids = [[self.vertex_ids[vertex] for vertex in simplex] for simplex in self.simplices]
+
+        faces = {}
+        for dim in range(self.dim + 1):
+            total = sum(comb(len(ids), dim + 1) for ids in simplex_ids)
+            faces[dim] = np.empty((total, dim + 1), dtype=np.int64)
+        offsets = dict.fromkeys(faces, 0)
+
+        for ids in simplex_ids:
+            for dim in range(len(ids)):
+                count = comb(len(ids), dim + 1)
+                block = np.fromiter(chain.from_iterable(combinations(ids, dim + 1)),
+                                    dtype=np.int64,
+                                    count=count*(dim + 1))
+                faces[dim][offsets[dim]:offsets[dim] + count] = block.reshape(count, dim + 1)
+                offsets[dim] += count
+
+        for dim, p_faces in faces.items():
+            unique_faces = np.unique(p_faces, axis=0).tolist()
+            self._p_simplices[dim] = [[self.vertex_names[i] for i in face]
+                                      for face in unique_faces]
     
     def get_all_simplices(self):
         """
-        Finds all simplices of a complex.
+        Finds all simplices of a complex, reusing p-simplices enumerated for all dimensions.
         
         Returns
         -------
@@ -131,20 +365,77 @@ class VietorisRipsComplex:
                    All simplices of a simplicial complex.
         """
 
-        simplices = [tuple(vertex) for vertex in self.vertex_names]
+        if not self._p_simplices:
+            self.enumerate_p_simplices()
+        return [simplex for dim in range(self.dim + 1) for simplex in self._p_simplices[dim]]
 
-        for simplex in self.simplices:
-            for dim in range(1, len(simplex)):
-                for face in combinations(simplex, dim+1):
-                    simplices.append(face)
-        
-        simplices = list(set(simplices))
-        simplices = [list(simplex) for simplex in simplices]
-        return sorted(simplices, key=lambda simplex: (len(simplex), simplex[0]))
+    def get_masks(self, simplices):
+        """
+        Encodes simplices as bitmasks over integer IDs of vertices, i.e. i-th bit
+        of a mask is set if and only if a simplex contains a vertex with ID i.
+
+        Arguments
+        ---------
+        simplices: list of list of str
+                   Simplices to encode.
+
+        Returns
+        -------
+        masks: ndarray
+               1D array of bitmasks, of dtype uint64 for up to 64 vertices
+               and of dtype object, i.e. Python int, otherwise.
+        """
+
+        masks = [sum(1 << self.vertex_ids[vertex] for vertex in simplex) for simplex in simplices]
+        if len(self.vertex_names) <= 64:
+            return np.array(masks, dtype=np.uint64)
+        return np.array(masks, dtype=object)
     
+    def get_p_masks(self, dim):
+        """
+        Returns bitmasks of all p-simplices of a complex. Bitmasks are created once per
+        dimension and shared by boundary matrices of dimensions p and p+1.
+
+        Arguments
+        ---------
+        dim: int
+             Dimension p of a p-simplex.
+
+        Returns
+        -------
+        masks: list of int
+               Bitmasks of p-simplices, in order of get_p_simplices.
+        """
+
+        if dim not in self._masks:
+            self._masks[dim] = self.get_masks(self.get_p_simplices(dim)).tolist()
+        return self._masks[dim]
+
     def get_p_boundary_matrix(self, dim):
+        """
+        Returns a p-th boundary matrix, i.e. a matrix of a p-th boundary operator.
+        Matrices are created once and cached.
+        
+        Arguments
+        ---------
+        dim: int
+             Dimension p of a p-th boundary operator.
+        
+        Returns
+        -------
+        boundary_matrix: GF(2)
+                         2D array, i.e. matrix with coefficients over Z/2Z.
+        """
+
+        if dim not in self._boundary_matrices:
+            self._boundary_matrices[dim] = self.construct_p_boundary_matrix(dim)
+        return self._boundary_matrices[dim]
+
+    def construct_p_boundary_matrix(self, dim):
         """
         Creates a p-th boundary matrix, i.e. a matrix of a p-th boundary operator.
+        Matrix is allocated directly in its final shape of p-1-simplices by p-simplices,
+        for dimensions without simplices a single zero row or column is used.
         
         Arguments
         ---------
@@ -160,32 +451,71 @@ class VietorisRipsComplex:
         p_simplices = self.get_p_simplices(dim)
         faces = self.get_p_simplices(dim - 1)
 
-        if p_simplices == [[]] and faces == [[]]:
-            boundary_matrix = self.field([[0]])
-            return boundary_matrix
+        boundary_matrix = np.zeros((len(faces), len(p_simplices)), dtype=np.uint8)
 
-        elif p_simplices == [[]]:
-            boundary_matrix = self.field(np.zeros(len(faces), dtype=int))
-            boundary_matrix = boundary_matrix.reshape([len(faces), 1])
-            return boundary_matrix
+        rows, cols = [], []
+        for col, column in enumerate(self.get_p_boundary_columns(dim)):
+            while column:
+                bit = column & -column
+                rows.append(bit.bit_length() - 1)
+                cols.append(col)
+                column ^= bit
+        boundary_matrix[rows, cols] = 1
+        
+        return self.field(boundary_matrix)
 
-        elif faces == [[]]:
-            boundary_matrix = self.field(np.zeros(len(p_simplices), dtype=int))
-            boundary_matrix = boundary_matrix.reshape([1, len(p_simplices)])
-            return boundary_matrix
+    def get_p_boundary_columns(self, dim):
+        """
+        Returns columns of a p-th boundary matrix in sparse form, i.e. as bitmasks over
+        indexes of rows, which are p-1-simplices of a face of a p-simplex. Columns are
+        created once and cached.
 
-        boundary_matrix = []
-        
-        for simplex in p_simplices:
-            boundary = []
-            for face in faces:
-                if set(face).issubset(set(simplex)):
-                    boundary.append(1)
-                else:
-                    boundary.append(0)
-            boundary_matrix.append(boundary)
-        
-        return np.transpose(self.field(boundary_matrix))
+        Arguments
+        ---------
+        dim: int
+             Dimension p of a p-th boundary operator.
+
+        Returns
+        -------
+        columns: list of int
+                 Columns of a p-th boundary matrix encoded as bitmasks over rows.
+        """
+
+        if dim not in self._boundary_columns:
+            self._boundary_columns[dim] = self.construct_p_boundary_columns(dim)
+        return self._boundary_columns[dim]
+
+    def construct_p_boundary_columns(self, dim):
+        """
+        Creates columns of a p-th boundary matrix in sparse form. Every p-simplex has exactly
+        p+1 faces, each found by removing one vertex from its bitmask.
+
+        Arguments
+        ---------
+        dim: int
+             Dimension p of a p-th boundary operator.
+
+        Returns
+        -------
+        columns: list of int
+                 Columns of a p-th boundary matrix encoded as bitmasks over rows.
+        """
+
+        if dim <= 0 or dim > self.dim:
+            return []
+
+        face_index = {mask: row for row, mask in enumerate(self.get_p_masks(dim - 1))}
+
+        columns = []
+        for mask in self.get_p_masks(dim):
+            column = 0
+            vertex_bits = mask
+            while vertex_bits:
+                bit = vertex_bits & -vertex_bits
+                column |= 1 << face_index[mask ^ bit]
+                vertex_bits ^= bit
+            columns.append(column)
+        return columns
     
     def get_p_betti(self, dim):
         """
@@ -202,24 +532,38 @@ class VietorisRipsComplex:
                p-th Betti number.
         """
 
-        p_boundary_matrix = self.get_p_boundary_matrix(dim)
-        p1_boundary_matrix = self.get_p_boundary_matrix(dim+1)
-
-        zero = self.field([[0]])
-        p_zero = np.array_equal(p_boundary_matrix, zero)
-        p1_zero = np.array_equal(p1_boundary_matrix, zero)
-        if p_zero and p1_zero:
+        if dim < 0 or dim > self.dim:
             return 0
 
-        col_num = p_boundary_matrix.shape[1]
-        p_rank = np.linalg.matrix_rank(p_boundary_matrix)
-        p1_rank = np.linalg.matrix_rank(p1_boundary_matrix)
+        col_num = len(self.get_p_simplices(dim))
+        p_rank = self.get_p_rank(dim) if dim > 0 else 0
+        p1_rank = self.get_p_rank(dim+1) if dim < self.dim else 0
         return col_num - p_rank - p1_rank
 
+    def get_p_rank(self, dim):
+        """
+        Returns rank of a p-th boundary matrix over Z/2Z. Ranks are calculated once
+        and cached, since every rank is shared by two consecutive Betti numbers.
+
+        Arguments
+        ---------
+        dim: int
+             Dimension p of a p-th boundary operator.
+
+        Returns
+        -------
+        rank: int
+              Rank of a p-th boundary matrix.
+        """
+
+        if dim not in self._ranks:
+            self._ranks[dim] = _gf2_rank(self.get_p_boundary_columns(dim))
+        return self._ranks[dim]
+
     def get_betti(self):
         """
         Returns all relevant Betti numbers of a simplicial complex, that is up to k-th one, 
-        where k is dimension of a simplicial complex.
+        where k is dimension of a simplicial complex. Betti numbers are calculated once.
 
         Returns
         -------
@@ -227,4 +571,6 @@ class VietorisRipsComplex:
                        All relevant Betti numbers of a simplicial complex.
         """
 
-        return [self.get_p_betti(p) for p in range(self.dim+1)]
\ No newline at end of file
+        if self._betti is None:
+            self._betti = [self.get_p_betti(p) for p in range(self.dim+1)]
+        return list(self._betti)
\ No newline at end of file
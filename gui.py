@@ -1,9 +1,90 @@
+import re
+import matplotlib
+import matplotlib.style
+matplotlib.use('Agg')
+matplotlib.style.use('fast')
+import numpy as np
 import ttkbootstrap as tb
-from matplotlib.pyplot import subplots
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from copy import copy
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from complexes import VietorisRipsComplex
 import metrics as m
-from plots import plot_2d_complex, plot_3d_complex
+from plots import (plot_2d_complex, plot_2d_edges, plot_2d_balls, plot_2d_simplices, 
+                   plot_3d_complex, plot_3d_simplices)
+
+
+_NUMBER = r'(?:\d+(?:[.,]\d*)?|[.,]\d+)'
+_NUMBER_PATTERN = re.compile(_NUMBER)
+_COORDS_PATTERNS = {}
+METRICS = [m.euclidean_metric, m.manhattan_metric, m.maximum_metric]
+LABELS = {
+    'en': {
+        'side_label': 'Simplicial Complex Settings',
+        'button_language': '[English] Change language',
+        'label_dimension': 'Enter dimension of space:',
+        'label_name': 'Enter vertex label:',
+        'label_coords': 'Enter vertex coordinates:',
+        'button_confirmation': 'Confirm vertex',
+        'menubutton_vertex': 'Added vertices',
+        'button_deletion': 'Delete vertices',
+        'menubutton_metric': 'Choose metric',
+        'metrics': ['Euclidean', 'Manhattan', 'Maximum'],
+        'label_radius': 'Enter radius:',
+        'toggle_graph': 'Draw graph',
+        'toggle_balls': 'Draw balls',
+        'button_generation': 'Generate plot',
+        'button_betti': 'Calculate Betti numbers',
+        'button_save': 'Save plot',
+        'Plot_Frame': 'Plot',
+        'Betti_Frame': 'Betti Numbers'
+    },
+    'pl': {
+        'side_label': 'Ustawienia Kompleksu Symplicjalnego',
+        'button_language': '[Polski] Zmień język',
+        'label_dimension': 'Podaj wymiar przestrzeni:',
+        'label_name': 'Podaj etykietę wierzchołka:',
+        'label_coords': 'Podaj współrzędne wierzchołka:',
+        'button_confirmation': 'Potwierdź wierzchołek',
+        'menubutton_vertex': 'Dodane wierzchołki',
+        'button_deletion': 'Usuń wierzchołek',
+        'menubutton_metric': 'Wybierz metrykę',
+        'metrics': ['Euklidesowa', 'Taksówkarza', 'Maksimum'],
+        'label_radius': 'Podaj promień:',
+        'toggle_graph': 'Rysuj graf',
+        'toggle_balls': 'Rysuj kule',
+        'button_generation': 'Wygeneruj wykres',
+        'button_betti': 'Oblicz liczby Bettiego',
+        'button_save': 'Zapisz wykres',
+        'Plot_Frame': 'Wykres',
+        'Betti_Frame': 'Liczby Bettiego'
+    }
+}
+
+
+def _coords_pattern(dim):
+    """
+    Returns compiled pattern matching dim numbers separated by single spaces.
+
+    Arguments
+    ---------
+    dim: int
+         Dimension of vertices.
+
+    Returns
+    -------
+    pattern: Pattern
+             Compiled pattern, cached per dimension.
+    """
+
+    pattern = _COORDS_PATTERNS.get(dim)
+    if pattern is None:
+        pattern = re.compile(f'{_NUMBER}(?: {_NUMBER}){{{dim-1}}}')
+        _COORDS_PATTERNS[dim] = pattern
+    return pattern
 
 
 class Main_Window(tb.Window):
@@ -21,12 +102,17 @@ class Main_Window(tb.Window):
               Currently displayed language.
     vertex_names: list of str
                   Labels of vertices.
-    vertex_coords: list of str
-                   Coordinates of vertices stored in string format.
-    metric: str, default='Euclidean'
-            Currently chosen metric stored in string format.
-    metric_dict: dict
-                 Dictionary for translation of metric string into metric function.
+    vertex_index: dict
+                  Translation of labels of vertices to their indexes in vertex_names.
+    vertex_coords: ndarray
+                   2D array of coordinates of vertices, i-th row belongs to i-th vertex.
+                   View of filled rows of coords_buffer.
+    coords_buffer: ndarray
+                   Preallocated storage of vertex_coords, its capacity grows by doubling.
+    coords_set: set of tuple
+                Coordinates of vertices, used to reject duplicates.
+    metric_func: function, default=euclidean_metric
+                 Currently chosen metric.
     complex: VietorisRipsComplex
              Instance of Vietoris-Rips complex.
     betti: list of int
@@ -39,10 +125,22 @@ class Main_Window(tb.Window):
                 If True then app generates plot of graph.
     draw_balls: tb.BooleanVar
                 If True then app draws balls according to the chosen metric.
+    plot_options: dict
+                  Keyword arguments of plotting functions mirroring draw_graph and draw_balls.
     Sidebar: Sidebar
              Sidebar used to place Frames used for customizing simplicial complex.
     Main_Frame: Main_Frame
                 Frame used to place other Frames displaying app output.
+    after_ids: dict
+               Identifiers of tasks scheduled by schedule.
+    executor: ThreadPoolExecutor
+              Worker thread for calculations, that would otherwise block the GUI.
+    dirty: set of str
+           Parts of the output ('complex' or 'artists') waiting to be rebuilt by flush.
+    flush_scheduled: bool
+                     If True then flush is already scheduled.
+    tcl_commands: dict
+                  Tcl command names of functions registered by tk_register.
     """
 
     def __init__(self, themename='cerculean'):
@@ -60,19 +158,21 @@ class Main_Window(tb.Window):
 
         self.language = 'en'
         self.vertex_names = []
-        self.vertex_coords = []
-        self.metric = 'Euclidean'
-        self.metric_dict = {
-            'Euclidean': m.euclidean_metric,
-            'Manhattan': m.manhattan_metric,
-            'Maximum': m.maximum_metric,
-            'Euklidesowa': m.euclidean_metric,
-            'Taksówkarza': m.manhattan_metric,
-            'Maksimum': m.maximum_metric
-        }
+        self.vertex_index = {}
+        self.coords_buffer = np.empty((0, 0), dtype=np.float64)
+        self.vertex_coords = self.coords_buffer
+        self.coords_set = set()
+        self.metric_func = m.euclidean_metric
         self.complex = None
         self.betti = None
-        self.fig, self.ax = subplots()
+        self.plot_options = {'draw_simplices': True, 'draw_balls': False}
+        self.fig = Figure(figsize=(5, 5), dpi=150, layout='tight')
+        self.ax = self.fig.add_subplot()
+        self.after_ids = {}
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.dirty = set()
+        self.flush_scheduled = False
+        self.tcl_commands = {}
 
         self.startup_complex_plot()
 
@@ -81,6 +181,8 @@ class Main_Window(tb.Window):
 
         self.Main_Frame = Main_Frame(self)
         self.Main_Frame.pack(fill='both', expand=True, padx=10, pady=10)
+
+        self.protocol('WM_DELETE_WINDOW', self.close)
     
     def startup_complex_plot(self):
         """
@@ -95,18 +197,139 @@ class Main_Window(tb.Window):
                                         radius=radius,
                                         vertex_names=vertex_names)
 
-        self.fig, self.ax = plot_2d_complex(vr_complex, 
-                                            fig=self.fig, 
-                                            ax=self.ax, 
-                                            return_fig=True,
-                                            show_plot=False)
+        plot_2d_complex(vr_complex, 
+                        fig=self.fig, 
+                        ax=self.ax, 
+                        return_fig=False,
+                        show_plot=False)
+
+    def close(self):
+        """
+        Releases resources of the app and destroys the window. Scheduled tasks and
+        pending calculations are cancelled, the figure is cleared once, on exit.
+        The window can be closed before frames of the sidebar are built.
+        """
+
+        for after_id in self.after_ids.values():
+            self.after_cancel(after_id)
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        Plot_Generation_Frame = getattr(self.Sidebar, 'Plot_Generation_Frame', None)
+        if Plot_Generation_Frame is not None:
+            Plot_Generation_Frame.results.clear()
+        self.fig.clear()
+        self.destroy()
+
+    def schedule(self, key, function, ms=150):
+        """
+        Runs function after ms milliseconds of quiet time. Function previously scheduled
+        with the same key is cancelled, so bursts of requests are coalesced into one call.
+
+        Arguments
+        ---------
+        key: str
+             Identifier of a scheduled task.
+        function: function
+                  Function to run.
+        ms: int, default=150
+            Delay in milliseconds.
+        """
+
+        if key in self.after_ids:
+            self.after_cancel(self.after_ids[key])
+        self.after_ids[key] = self.after(ms, function)
 
-    def convert_coords_to_float(self):
+    def tk_register(self, function):
         """
-        Converts vertex_coords from list of str to list of float.
+        Registers function as a Tcl command. Function registered before is not registered
+        again, its previous command name is returned instead.
+
+        Arguments
+        ---------
+        function: function
+                  Function to register.
+
+        Returns
+        -------
+        command: str
+                 Name of Tcl command.
+        """
+
+        command = self.tcl_commands.get(function)
+        if command is None:
+            command = self.register(function)
+            self.tcl_commands[function] = command
+        return command
+
+    def mark_dirty(self, part):
         """
+        Marks part of the output as outdated. Output is rebuilt once the app is idle,
+        so consecutive changes are handled by a single rebuild.
+
+        Arguments
+        ---------
+        part: str
+              Either 'complex' or 'artists'.
+        """
+
+        self.dirty.add(part)
+        if not self.flush_scheduled:
+            self.flush_scheduled = True
+            self.after_idle(self.flush)
+
+    def flush(self):
+        """
+        Rebuilds outdated parts of the output. Nothing is rebuilt before the first
+        generated plot. Rebuilding the complex also replots it and updates Betti numbers.
+        """
+
+        dirty = self.dirty
+        self.dirty = set()
+        self.flush_scheduled = False
 
-        return [[float(coord) for coord in vertex] for vertex in self.vertex_coords]
+        if self.complex is None:
+            return
+
+        if 'complex' in dirty:
+            self.Sidebar.Plot_Generation_Frame.generate_plot()
+        elif 'artists' in dirty:
+            self.Main_Frame.Plot_Frame.update_artists()
+
+    def append_coords(self, coords):
+        """
+        Appends coordinates of a new vertex to vertex_coords. Storage is reallocated only
+        when it is full or when dimension of vertices changes.
+
+        Arguments
+        ---------
+        coords: ndarray
+                Coordinates of a new vertex.
+        """
+
+        vertex_num = len(self.vertex_coords)
+
+        if vertex_num == 0 or self.coords_buffer.shape[1] != len(coords):
+            self.coords_buffer = np.empty((4, len(coords)), dtype=np.float64)
+        elif vertex_num == len(self.coords_buffer):
+            coords_buffer = np.empty((2*vertex_num, len(coords)), dtype=np.float64)
+            coords_buffer[:vertex_num] = self.vertex_coords
+            self.coords_buffer = coords_buffer
+
+        self.coords_buffer[vertex_num] = coords
+        self.vertex_coords = self.coords_buffer[:vertex_num+1]
+
+    def delete_coords(self, index):
+        """
+        Deletes coordinates of a vertex from vertex_coords in place.
+
+        Arguments
+        ---------
+        index: int
+               Index of a vertex.
+        """
+
+        vertex_num = len(self.vertex_coords)
+        self.coords_buffer[index:vertex_num-1] = self.coords_buffer[index+1:vertex_num]
+        self.vertex_coords = self.coords_buffer[:vertex_num-1]
 
 
 class Sidebar(tb.Frame):
@@ -142,7 +365,7 @@ class Sidebar(tb.Frame):
 
     def __init__(self, root, bootstyle='light'):
         """
-        Initializes all frames packed inside Sidebar.
+        Initializes Title_Frame and schedules initialization of remaining frames.
 
         Parameters
         ----------
@@ -158,35 +381,28 @@ class Sidebar(tb.Frame):
         self.Title_Frame = Title_Frame(self)
         self.Title_Frame.pack()
 
-        self.pack_separator()
-
-        self.Dimension_Frame = Dimension_Frame(self)
-        self.Dimension_Frame.pack()
+        self.after_idle(self.build_frames)
 
-        self.pack_separator()
-
-        self.Vertex_Addition_Frame = Vertex_Addition_Frame(self)
-        self.Vertex_Addition_Frame.pack()
-
-        self.pack_separator()
-
-        self.Vertex_List_Frame = Vertex_List_Frame(self)
-        self.Vertex_List_Frame.pack()
-
-        self.pack_separator()
-
-        self.Metric_Frame = Metric_Frame(self)
-        self.Metric_Frame.pack()
-
-        self.pack_separator()
-
-        self.Plot_Config_Frame = Plot_Config_Frame(self)
-        self.Plot_Config_Frame.pack()
+    def build_frames(self):
+        """
+        Initializes and packs remaining frames in a single batch once the window is idle,
+        so that the first paint of the app is not delayed by their construction.
+        """
 
-        self.pack_separator()
+        frames = [
+            ('Dimension_Frame', Dimension_Frame),
+            ('Vertex_Addition_Frame', Vertex_Addition_Frame),
+            ('Vertex_List_Frame', Vertex_List_Frame),
+            ('Metric_Frame', Metric_Frame),
+            ('Plot_Config_Frame', Plot_Config_Frame),
+            ('Plot_Generation_Frame', Plot_Generation_Frame)
+        ]
 
-        self.Plot_Generation_Frame = Plot_Generation_Frame(self)
-        self.Plot_Generation_Frame.pack()
+        for name, frame_class in frames:
+            self.pack_separator()
+            frame = frame_class(self)
+            frame.pack()
+            setattr(self, name, frame)
 
     def pack_separator(self):
         """
@@ -224,22 +440,6 @@ class Sidebar_Frame(tb.Frame):
         tb.Frame.__init__(self, root, bootstyle=bootstyle)
         self.Main_Window = root.Main_Window
         self.Sidebar = root
-    
-    def pack_hidden_separator(self, bootstyle='light'):
-        """
-        Packs hidden separator for spacing.
-        """
-
-        separator = tb.Separator(self, bootstyle=bootstyle)
-        separator.pack(pady=5)
-    
-    def grid_hidden_separator(self, row, column, columnspan, bootstyle='light'):
-        """
-        Grids hidden separator for spacing.
-        """
-
-        separator = tb.Separator(self, bootstyle=bootstyle)
-        separator.grid(row=row, column=column, columnspan=columnspan, pady=5)
 
 
 class Title_Frame(Sidebar_Frame):
@@ -293,7 +493,8 @@ class Title_Frame(Sidebar_Frame):
 
     def change_language(self):
         """
-        Changes the displayed language by swapping all visible texts.
+        Changes the displayed language by swapping all visible texts. Texts are taken
+        from LABELS and metric menu entries are relabelled in place.
         """
 
         Dimension_Frame = self.Sidebar.Dimension_Frame
@@ -302,93 +503,41 @@ class Title_Frame(Sidebar_Frame):
         Metric_Frame = self.Sidebar.Metric_Frame
         Plot_Config_Frame = self.Sidebar.Plot_Config_Frame
         Plot_Generation_Frame = self.Sidebar.Plot_Generation_Frame
-        Plot_Frame = self.Main_Window.Main_Frame.Plot_Frame
-        Betti_Frame = self.Main_Window.Main_Frame.Betti_Frame
 
-        if self.Main_Window.language == 'en':
-            self.Main_Window.language = 'pl'
-            
-            self.side_label.config(text='Ustawienia Kompleksu Symplicjalnego')
-            self.button_language.config(text='[Polski] Zmień język')
-
-            Dimension_Frame.label_dimension.config(text='Podaj wymiar przestrzeni:')
-
-            Vertex_Addition_Frame.label_name.config(text='Podaj etykietę wierzchołka:')
-            Vertex_Addition_Frame.label_coords.config(text='Podaj współrzędne wierzchołka:')
-            Vertex_Addition_Frame.button_confirmation.config(text='Potwierdź wierzchołek')
-
-            Vertex_List_Frame.menubutton_vertex.config(text='Dodane wierzchołki')
-            Vertex_List_Frame.button_deletion.config(text='Usuń wierzchołek')
-
-            Metric_Frame.menu_metric = tb.Menu(Metric_Frame.menubutton_metric)
-
-            self.Main_Window.metric = 'Euklidesowa'
-            Metric_Frame.menubutton_metric.config(text='Wybierz metrykę')
-            Metric_Frame.available_metrics = ['Euklidesowa', 'Taksówkarza', 'Maksimum']
-            for metric in Metric_Frame.available_metrics:
-                Metric_Frame.menu_metric.add_radiobutton(
-                    label=metric, 
-                    command= lambda x=metric: Metric_Frame.set_metric(metric=x))
-                
-            Metric_Frame.menubutton_metric['menu'] = Metric_Frame.menu_metric
-
-            Metric_Frame.label_radius.config(text='Podaj promień:')
-
-            Plot_Config_Frame.toggle_graph.config(text='Rysuj graf')
-            Plot_Config_Frame.toggle_balls.config(text='Rysuj kule')
-
-            Plot_Generation_Frame.button_generation.config(text='Wygeneruj wykres')
-            if Dimension_Frame.entry_dimension.get().isdecimal():
-                dim = int(Dimension_Frame.entry_dimension.get())
-                if dim != 2 and dim != 3:
-                    self.Sidebar.Plot_Generation_Frame.button_generation.config(text='Oblicz liczby Bettiego')
-            Plot_Generation_Frame.button_save.config(text='Zapisz wykres')
+        language = 'pl' if self.Main_Window.language == 'en' else 'en'
+        self.Main_Window.language = language
+        labels = LABELS[language]
+
+        widgets = {
+            'side_label': self.side_label,
+            'button_language': self.button_language,
+            'label_dimension': Dimension_Frame.label_dimension,
+            'label_name': Vertex_Addition_Frame.label_name,
+            'label_coords': Vertex_Addition_Frame.label_coords,
+            'button_confirmation': Vertex_Addition_Frame.button_confirmation,
+            'menubutton_vertex': Vertex_List_Frame.menubutton_vertex,
+            'button_deletion': Vertex_List_Frame.button_deletion,
+            'menubutton_metric': Metric_Frame.menubutton_metric,
+            'label_radius': Metric_Frame.label_radius,
+            'toggle_graph': Plot_Config_Frame.toggle_graph,
+            'toggle_balls': Plot_Config_Frame.toggle_balls,
+            'button_save': Plot_Generation_Frame.button_save,
+            'Plot_Frame': self.Main_Window.Main_Frame.Plot_Frame,
+            'Betti_Frame': self.Main_Window.Main_Frame.Betti_Frame
+        }
+        for key, widget in widgets.items():
+            widget.config(text=labels[key])
 
-            Plot_Frame.config(text='Wykres')
+        Metric_Frame.available_metrics = labels['metrics']
+        self.Main_Window.metric_func = METRICS[0]
+        for index, metric in enumerate(Metric_Frame.available_metrics):
+            Metric_Frame.menu_metric.entryconfigure(index, label=metric)
 
-            Betti_Frame.config(text='Liczby Bettiego')
+        dim = Dimension_Frame.last_dimension
+        if dim != '' and int(dim) != 2 and int(dim) != 3:
+            Plot_Generation_Frame.button_generation.config(text=labels['button_betti'])
         else:
-            self.Main_Window.language = 'en'
-
-            self.side_label.config(text='Simplicial Complex Settings')
-            self.button_language.config(text='[English] Change language')
-
-            Dimension_Frame.label_dimension.config(text='Enter dimension of space:')
-
-            Vertex_Addition_Frame.label_name.config(text='Enter vertex label:')
-            Vertex_Addition_Frame.label_coords.config(text='Enter vertex coordinates:')
-            Vertex_Addition_Frame.button_confirmation.config(text='Confirm vertex')
-
-            Vertex_List_Frame.menubutton_vertex.config(text='Added vertices')
-            Vertex_List_Frame.button_deletion.config(text='Delete vertices')
-
-            Metric_Frame.menu_metric = tb.Menu(Metric_Frame.menubutton_metric)
-
-            self.Main_Window.metric = 'Euclidean'
-            Metric_Frame.menubutton_metric.config(text='Choose metric')
-            Metric_Frame.available_metrics = ['Euclidean', 'Manhattan', 'Maximum']
-            for metric in Metric_Frame.available_metrics:
-                Metric_Frame.menu_metric.add_radiobutton(
-                    label=metric, 
-                    command= lambda x=metric: Metric_Frame.set_metric(metric=x))
-                
-            Metric_Frame.menubutton_metric['menu'] = Metric_Frame.menu_metric
-
-            Metric_Frame.label_radius.config(text='Enter radius:')
-
-            Plot_Config_Frame.toggle_graph.config(text='Draw graph')
-            Plot_Config_Frame.toggle_balls.config(text='Draw balls')
-
-            Plot_Generation_Frame.button_generation.config(text='Generate plot')
-            if Dimension_Frame.entry_dimension.get().isdecimal():
-                dim = int(Dimension_Frame.entry_dimension.get())
-                if dim != 2 and dim != 3:
-                    self.Sidebar.Plot_Generation_Frame.button_generation.config(text='Calculate Betti numbers')
-            Plot_Generation_Frame.button_save.config(text='Save plot')
-
-            Plot_Frame.config(text='Plot')
-
-            Betti_Frame.config(text='Betti Numbers')
+            Plot_Generation_Frame.button_generation.config(text=labels['button_generation'])
 
 
 class Dimension_Frame(Sidebar_Frame):
@@ -410,8 +559,14 @@ class Dimension_Frame(Sidebar_Frame):
              Sidebar this frame is packed upon.
     label_dimension: tb.Label
                      Label for entry_dimension.
+    dimension_text: tb.StringVar
+                    Text of entry_dimension.
     entry_dimension: tb.Entry
                      Entry for getting dimension of vertices.
+    last_dimension: str
+                    Last validated output from entry_dimension.
+    dim: int or None
+         Dimension parsed from entry_dimension, None if it is not valid.
     """
 
     def __init__(self, root):
@@ -427,18 +582,33 @@ class Dimension_Frame(Sidebar_Frame):
         """
 
         Sidebar_Frame.__init__(self, root)
+        self.last_dimension = ''
+        self.dim = None
 
         self.label_dimension = tb.Label(self, text='Enter dimension of space:', bootstyle='inverse-light')
         self.label_dimension.pack()
 
-        validation_dimension = self.Main_Window.register(self.validate_dimension)
+        self.dimension_text = tb.StringVar()
+        self.dimension_text.trace_add('write', self.parse_dimension)
 
-        self.entry_dimension = tb.Entry(self, validate='focusout', validatecommand=(validation_dimension, '%P'))
+        self.entry_dimension = tb.Entry(self, textvariable=self.dimension_text)
         self.entry_dimension.pack()
+
+    def parse_dimension(self, *args):
+        """
+        Validates dimension on every change of entry_dimension and stores it in dim.
+        """
+
+        dim = self.dimension_text.get()
+        validated = self.validate_dimension(dim)
+
+        self.dim = int(dim) if validated else None
+        self.entry_dimension.state(['!invalid'] if validated else ['invalid'])
     
     def validate_dimension(self, dim):
         """
-        Validates entry_dimension output by checking characters. Autodisables uncompatible options.
+        Validates entry_dimension output by checking characters. Autodisabling of uncompatible
+        options is debounced and skipped if dimension did not change since last validation.
 
         Arguments
         ---------
@@ -451,45 +621,46 @@ class Dimension_Frame(Sidebar_Frame):
                    True if dim is an integer.
         """
 
-        if dim.isdecimal():
-            if int(dim) == 2:
-                self.Sidebar.Plot_Config_Frame.toggle_graph.config(state='normal')
-                self.Sidebar.Plot_Config_Frame.toggle_balls.config(state='normal')
+        if not dim.isdecimal():
+            return False
+
+        if dim != self.last_dimension:
+            self.last_dimension = dim
+            self.Main_Window.schedule('dimension', partial(self.update_options, int(dim)))
 
-                self.Sidebar.Plot_Generation_Frame.button_save.config(state='normal')
-                if self.Main_Window.language == 'en':
-                    self.Sidebar.Plot_Generation_Frame.button_generation.config(text='Generate plot')
-                else:
-                    self.Sidebar.Plot_Generation_Frame.button_generation.config(text='Wygeneruj wykres')
+        return int(dim) != 0
 
-                return True
-            elif int(dim) == 3:
-                self.Sidebar.Plot_Config_Frame.toggle_graph.config(state='normal')
-                self.Sidebar.Plot_Config_Frame.toggle_balls.config(state='disabled')
+    def update_options(self, dim):
+        """
+        Enables options compatible with dimension and disables the rest.
 
-                self.Sidebar.Plot_Generation_Frame.button_save.config(state='normal')
-                if self.Main_Window.language == 'en':
-                    self.Sidebar.Plot_Generation_Frame.button_generation.config(text='Generate plot')
-                else:
-                    self.Sidebar.Plot_Generation_Frame.button_generation.config(text='Wygeneruj wykres')
+        Arguments
+        ---------
+        dim: int
+             Validated dimension of vertices.
+        """
 
-                return True
-            else:
-                self.Sidebar.Plot_Config_Frame.toggle_graph.config(state='disabled')
-                self.Sidebar.Plot_Config_Frame.toggle_balls.config(state='disabled')
+        if dim == 2:
+            self.Sidebar.Plot_Config_Frame.toggle_graph.config(state='normal')
+            self.Sidebar.Plot_Config_Frame.toggle_balls.config(state='normal')
 
-                self.Sidebar.Plot_Generation_Frame.button_save.config(state='disabled')
-                if self.Main_Window.language == 'en':
-                    self.Sidebar.Plot_Generation_Frame.button_generation.config(text='Calculate Betti numbers')
-                else:
-                    self.Sidebar.Plot_Generation_Frame.button_generation.config(text='Oblicz liczby Bettiego')
-                
-                if int(dim) == 0:
-                    return False
-                else:
-                    return True
+            self.Sidebar.Plot_Generation_Frame.button_save.config(state='normal')
+            self.Sidebar.Plot_Generation_Frame.button_generation.config(
+                text=LABELS[self.Main_Window.language]['button_generation'])
+        elif dim == 3:
+            self.Sidebar.Plot_Config_Frame.toggle_graph.config(state='normal')
+            self.Sidebar.Plot_Config_Frame.toggle_balls.config(state='disabled')
+
+            self.Sidebar.Plot_Generation_Frame.button_save.config(state='normal')
+            self.Sidebar.Plot_Generation_Frame.button_generation.config(
+                text=LABELS[self.Main_Window.language]['button_generation'])
         else:
-            return False
+            self.Sidebar.Plot_Config_Frame.toggle_graph.config(state='disabled')
+            self.Sidebar.Plot_Config_Frame.toggle_balls.config(state='disabled')
+
+            self.Sidebar.Plot_Generation_Frame.button_save.config(state='disabled')
+            self.Sidebar.Plot_Generation_Frame.button_generation.config(
+                text=LABELS[self.Main_Window.language]['button_betti'])
 
 
 class Vertex_Addition_Frame(Sidebar_Frame):
@@ -520,6 +691,10 @@ class Vertex_Addition_Frame(Sidebar_Frame):
     button_confirmation: tb.Button
                          Confirmation of addition of new vertex. 
                          Clears out entries upon being pressed.
+    parsed_coords: ndarray
+                   Coordinates parsed during last successful validation.
+    parsed_text: str or None
+                 Text parsed into parsed_coords.
     """
 
     def __init__(self, root):
@@ -535,40 +710,65 @@ class Vertex_Addition_Frame(Sidebar_Frame):
         """
 
         Sidebar_Frame.__init__(self, root)
+        self.parsed_coords = np.empty(0, dtype=np.float64)
+        self.parsed_text = None
 
         self.label_name = tb.Label(self, 
                                    text='Enter vertex label:', 
                                    bootstyle='inverse-light')
         self.label_name.pack()
 
-        validation_name = self.Main_Window.register(self.validate_name)
-
-        self.entry_name = tb.Entry(self,
-                                   validate='focusout',
-                                   validatecommand=(validation_name, '%P'))
+        self.entry_name = tb.Entry(self)
+        validation_name = self.Main_Window.tk_register(
+            partial(self.debounce_validation, self.entry_name, self.validate_name))
+        self.entry_name.config(validate='focusout', 
+                               validatecommand=(validation_name, '%P'))
         self.entry_name.pack()
 
-        self.pack_hidden_separator()
-
         self.label_coords = tb.Label(self, 
                                      text='Enter vertex coordinates:', 
                                      bootstyle='inverse-light')
-        self.label_coords.pack()
+        self.label_coords.pack(pady=(10, 0))
 
-        validation_coords = self.Main_Window.register(self.validate_coords)
-
-        self.entry_coords = tb.Entry(self, 
-                                     validate='focusout', 
-                                     validatecommand=(validation_coords, '%P'))
+        self.entry_coords = tb.Entry(self)
+        validation_coords = self.Main_Window.tk_register(
+            partial(self.debounce_validation, self.entry_coords, self.validate_coords))
+        self.entry_coords.config(validate='focusout', 
+                                 validatecommand=(validation_coords, '%P'))
         self.entry_coords.pack()
 
-        self.pack_hidden_separator()
-
         self.button_confirmation = tb.Button(self, 
                                              text='Confirm vertex', 
                                              bootstyle='primary', 
                                              command=self.vertex_confirmation)
-        self.button_confirmation.pack(pady=10)
+        self.button_confirmation.pack(pady=(20, 10))
+
+    def debounce_validation(self, entry, validate, text):
+        """
+        Schedules validation of entry text, so that focus changes in quick succession
+        are validated only once. Entry is marked invalid once validation fails.
+
+        Arguments
+        ---------
+        entry: tb.Entry
+               Validated entry.
+        validate: function
+                  Validator of entry text.
+        text: str
+              Text of entry.
+
+        Returns
+        -------
+        validated: bool
+                   Always True, actual result is applied once validation runs.
+        """
+
+        def run_validation():
+            validated = validate(text)
+            entry.state(['!invalid'] if validated else ['invalid'])
+
+        self.Main_Window.schedule(f'validate {entry}', run_validation, ms=100)
+        return True
 
     def validate_name(self, name):
         """
@@ -585,7 +785,7 @@ class Vertex_Addition_Frame(Sidebar_Frame):
                    True if name is unique.
         """
 
-        if name == '' or name in self.Main_Window.vertex_names:
+        if name == '' or name in self.Main_Window.vertex_index:
             return False
         else:
             return True
@@ -593,6 +793,8 @@ class Vertex_Addition_Frame(Sidebar_Frame):
     def validate_coords(self, coords_text):
         """
         Validates coordinates by checking their type, their amount and uniqueness.
+        Coordinates have to match dimension of previously added vertices.
+        Coordinates are parsed in the same pass and stored in parsed_coords.
 
         Arguments
         ---------
@@ -605,36 +807,53 @@ class Vertex_Addition_Frame(Sidebar_Frame):
                    True if correct type, amount and if is unique.
         """
 
-        coords = coords_text.replace(',', '').split(' ')
-        dim = self.Sidebar.Dimension_Frame.entry_dimension.get()
+        coords_text = coords_text.replace(',', '.')
+        dim = self.Sidebar.Dimension_Frame.dim
         
-        if not dim.isdecimal():
+        if dim is None:
             return False
-        elif len(coords) != int(dim):
-            return False
-        
-        for coord in coords:
-            if not coord.replace('.', '').isdecimal():
+
+        if coords_text == self.parsed_text and len(self.parsed_coords) == dim:
+            parsed_coords = self.parsed_coords
+        else:
+            parsed_coords = self.parse_coords(coords_text, dim)
+            if parsed_coords is None:
+                return False
+
+        vertex_coords = self.Main_Window.vertex_coords
+        if len(vertex_coords) > 0:
+            if vertex_coords.shape[1] != dim:
+                return False
+            if tuple(parsed_coords.tolist()) in self.Main_Window.coords_set:
                 return False
         
-        if coords in self.Main_Window.vertex_coords:
-            return False
-        
+        self.parsed_coords = parsed_coords
+        self.parsed_text = coords_text
         return True
-    
-    def get_coords(self):
+
+    def parse_coords(self, coords_text, dim):
         """
-        Get coordinates from entry as a list of str.
+        Checks type and amount of coordinates with a single pattern match, then converts
+        them to floats at once.
+
+        Arguments
+        ---------
+        coords_text: str
+                     Coordinates stored in one string, with decimal commas already
+                     replaced by points.
+        dim: int
+             Dimension of vertices.
 
         Returns
         -------
-        coords: list of str
-                Coordinates from entry.
+        parsed_coords: ndarray or None
+                       Parsed coordinates, None if coordinates are not correct.
         """
 
-        coords_text = self.entry_coords.get()
-        coords = coords_text.replace(',', '.').split(' ')
-        return coords
+        if dim < 1 or not _coords_pattern(dim).fullmatch(coords_text):
+            return None
+
+        return np.array(coords_text.split(' '), dtype=np.float64)
     
     def get_str_coords(self):
         """
@@ -655,8 +874,8 @@ class Vertex_Addition_Frame(Sidebar_Frame):
         Clears entry_name and entry_coords.
         """
 
-        self.entry_name.delete(0, len(self.entry_name.get()))
-        self.entry_coords.delete(0, len(self.entry_coords.get()))
+        self.entry_name.delete(0, 'end')
+        self.entry_coords.delete(0, 'end')
 
     def vertex_confirmation(self):
         """
@@ -666,25 +885,21 @@ class Vertex_Addition_Frame(Sidebar_Frame):
         vertex_name = self.entry_name.get()
         unique_name = self.validate_name(vertex_name)
 
-        dim_text = self.Sidebar.Dimension_Frame.entry_dimension.get()
-        dim_chosen = self.Sidebar.Dimension_Frame.validate_dimension(dim_text)
+        dim_chosen = self.Sidebar.Dimension_Frame.dim is not None
 
         coords_txt = self.get_str_coords()
         coords_validated = self.validate_coords(coords_txt)
         
         if unique_name and dim_chosen and coords_validated:
+            self.Main_Window.vertex_index[vertex_name] = len(self.Main_Window.vertex_names)
             self.Main_Window.vertex_names.append(vertex_name)
-            self.Main_Window.vertex_coords.append(self.get_coords())
+            coords = self.parsed_coords
+            self.Main_Window.append_coords(coords)
+            self.Main_Window.coords_set.add(tuple(coords.tolist()))
 
-            Vertex_List_Frame = self.Sidebar.Vertex_List_Frame
+            text = f'{vertex_name}: {coords_txt}'
 
-            coords_text = self.get_str_coords()
-            text = f'{vertex_name}: {coords_text}'
-
-            Vertex_List_Frame.menu_vertex.add_radiobutton(
-                label=text,
-                command= lambda x=text: Vertex_List_Frame.waitlist(x)
-            )
+            self.Sidebar.Vertex_List_Frame.add_vertex_entry(text)
 
             self.clear_entries()
 
@@ -713,6 +928,8 @@ class Vertex_List_Frame(Sidebar_Frame):
     menu_vertex: tb.Menu
                  List of previously added vertices. 
                  Check vertices to flag them for deletion.
+    waitlist_command: str
+                      Tcl command of waitlist shared by all entries of menu_vertex.
     button_deletion: tb.Button
                      Button for deletion of all flagged vertices.
     """
@@ -737,17 +954,47 @@ class Vertex_List_Frame(Sidebar_Frame):
                                                bootstyle='secondary')
         self.menubutton_vertex.pack()
 
-        self.menu_vertex = tb.Menu(self.menubutton_vertex)
+        self.menu_vertex = tb.Menu(self.menubutton_vertex, tearoff=False)
 
         self.menubutton_vertex['menu'] = self.menu_vertex
 
-        self.pack_hidden_separator()
+        self.waitlist_command = self.Main_Window.tk_register(self.waitlist)
 
         self.button_deletion = tb.Button(self, 
                                          text='Delete vertices', 
                                          bootstyle='primary',
                                          command=self.vertex_deletion)
-        self.button_deletion.pack()
+        self.button_deletion.pack(pady=(10, 0))
+
+    def add_vertex_entry(self, text):
+        """
+        Adds an entry of a vertex at the end of menu_vertex.
+
+        Arguments
+        ---------
+        text: str
+              Label of an entry in format 'name: coordinates'.
+        """
+
+        self.add_vertex_entries([text])
+
+    def add_vertex_entries(self, texts):
+        """
+        Adds entries of vertices at the end of menu_vertex. Entries are added directly
+        through Tcl and share one registered command, which makes adding many vertices cheap.
+
+        Arguments
+        ---------
+        texts: list of str
+               Labels of entries in format 'name: coordinates'.
+        """
+
+        call = self.menu_vertex.tk.call
+        menu = self.menu_vertex._w
+        command = self.waitlist_command
+
+        for text in texts:
+            call(menu, 'add', 'radiobutton', '-label', text, '-command', (command, text))
 
     def waitlist(self, vertex):
         """
@@ -758,40 +1005,29 @@ class Vertex_List_Frame(Sidebar_Frame):
 
     def vertex_deletion(self):
         """
-        Deletes flagged vertices and create new list of remaining vertices.
+        Deletes flagged vertices and removes their entries from menu_vertex. Entries are
+        removed directly through Tcl, because their shared command is not a command
+        owned by the menu, which tkinter's Menu.delete would try to delete.
         """
 
         vertex_txt = self.vertex_to_delete
 
         if vertex_txt != '':
             vertex_name = vertex_txt.split(':')[0]
-            vertex_index = self.Main_Window.vertex_names.index(vertex_name)
+            vertex_index = self.Main_Window.vertex_index[vertex_name]
+
+            self.menu_vertex.tk.call(self.menu_vertex._w, 'delete', vertex_index)
 
+            del self.Main_Window.vertex_index[vertex_name]
             self.Main_Window.vertex_names.pop(vertex_index)
-            self.Main_Window.vertex_coords.pop(vertex_index)
+            for remaining_vertex_name in self.Main_Window.vertex_names[vertex_index:]:
+                self.Main_Window.vertex_index[remaining_vertex_name] -= 1
+            self.Main_Window.coords_set.discard(
+                tuple(self.Main_Window.vertex_coords[vertex_index].tolist()))
+            self.Main_Window.delete_coords(vertex_index)
 
             self.vertex_to_delete = ''
 
-            self.menu_vertex = tb.Menu(self.menubutton_vertex)
-
-            for index in range(len(self.Main_Window.vertex_names)):
-                remaining_vertex_name = self.Main_Window.vertex_names[index]
-                remaining_vertex_coords = self.Main_Window.vertex_coords[index]
-
-                remaining_vertex_coords_txt = ''
-                for coord_index in range(len(remaining_vertex_coords)-1):
-                    remaining_vertex_coords_txt += remaining_vertex_coords[coord_index]+' '
-                remaining_vertex_coords_txt += remaining_vertex_coords[-1]
-
-                text = f'{remaining_vertex_name}: {remaining_vertex_coords_txt}'
-
-                self.menu_vertex.add_radiobutton(
-                    label=text,
-                    command= lambda x=text: self.waitlist(x)
-                )
-
-            self.menubutton_vertex['menu'] = self.menu_vertex
-
 
 class Metric_Frame(Sidebar_Frame):
     """
@@ -815,11 +1051,15 @@ class Metric_Frame(Sidebar_Frame):
     menu_metric: tb.Menu
                  Menu displaying available metrics.
     available_metrics: list of str
-                       List of available metrics.
+                       Displayed names of metrics in METRICS, in current language.
     label_radius: tb.Label
                   Label for entry_radius.
+    radius_text: tb.StringVar
+                 Text of entry_radius.
     entry_radius: tb.Entry
                   Entry for getting radius.
+    radius: float or None
+            Radius parsed from entry_radius, None if it is not valid.
     """
 
     def __init__(self, root):
@@ -831,41 +1071,39 @@ class Metric_Frame(Sidebar_Frame):
         self.menubutton_metric.pack()
 
         self.menu_metric = tb.Menu(self.menubutton_metric)
-        self.available_metrics = ['Euclidean', 'Manhattan', 'Maximum']
-        for metric in self.available_metrics:
+        self.available_metrics = LABELS['en']['metrics']
+        for index, metric in enumerate(self.available_metrics):
             self.menu_metric.add_radiobutton(label=metric, 
-                                             command= lambda x=metric: self.set_metric(metric=x))
+                                             command=partial(self.set_metric, index))
 
         self.menubutton_metric['menu'] = self.menu_metric
 
-        self.pack_hidden_separator()
-
         self.label_radius = tb.Label(self, 
                                      text='Enter radius:', 
                                      bootstyle='inverse-light')
-        self.label_radius.pack()
+        self.label_radius.pack(pady=(10, 0))
 
-        validation_radius = self.Main_Window.register(self.validate_radius)
+        self.radius = None
+        self.radius_text = tb.StringVar()
+        self.radius_text.trace_add('write', self.parse_radius)
 
-        self.entry_radius = tb.Entry(self, 
-                                     validate='focusout', 
-                                     validatecommand=(validation_radius, '%P'))
+        self.entry_radius = tb.Entry(self, textvariable=self.radius_text)
         self.entry_radius.pack()
 
-    def set_metric(self, metric):
+    def set_metric(self, index):
         """
-        Initializes all widgets packed inside.
+        Chooses metric and displays its name on menubutton_metric. Entries of menu_metric
+        refer to metrics by index, so changing language only relabels them.
 
         Arguments
         ---------
-        root: Main_Window
-            Root upon this Sidebar is packed.
-        bootstyle: str, default='light'
-                Style of widget.
+        index: int
+               Index of chosen metric in METRICS and available_metrics.
         """
 
-        self.menubutton_metric.config(text=metric)
-        self.Main_Window.metric = metric
+        self.menubutton_metric.config(text=self.available_metrics[index])
+        self.Main_Window.metric_func = METRICS[index]
+        self.Main_Window.mark_dirty('complex')
 
     def validate_radius(self, radius):
         """
@@ -881,11 +1119,18 @@ class Metric_Frame(Sidebar_Frame):
         validated: bool
                    True if correct type.
         """
-        radius = radius.replace(',', '').replace('.', '')
-        if radius.isdecimal():
-            return True
-        else:
-            return False
+        return _NUMBER_PATTERN.fullmatch(radius) is not None
+
+    def parse_radius(self, *args):
+        """
+        Validates radius on every change of entry_radius and stores it in radius.
+        """
+
+        radius = self.radius_text.get()
+        validated = self.validate_radius(radius)
+
+        self.radius = float(radius.replace(',', '.')) if validated else None
+        self.entry_radius.state(['!invalid'] if validated else ['invalid'])
         
 
 class Plot_Config_Frame(Sidebar_Frame):
@@ -926,6 +1171,7 @@ class Plot_Config_Frame(Sidebar_Frame):
         Sidebar_Frame.__init__(self, root)
 
         self.Main_Window.draw_graph = tb.BooleanVar()
+        self.Main_Window.draw_graph.trace_add('write', self.update_plot_options)
         self.toggle_graph = tb.Checkbutton(self, 
                                            bootstyle="secondary-outline-toolbutton", 
                                            text='Draw graph',
@@ -933,12 +1179,27 @@ class Plot_Config_Frame(Sidebar_Frame):
         self.toggle_graph.grid(row=0, column=0)
 
         self.Main_Window.draw_balls = tb.BooleanVar()
+        self.Main_Window.draw_balls.trace_add('write', self.update_plot_options)
         self.toggle_balls = tb.Checkbutton(self, 
                                            bootstyle="secondary-outline-toolbutton", 
                                            text='Draw balls',
                                            variable=self.Main_Window.draw_balls)
         self.toggle_balls.grid(row=0, column=1)
 
+    def update_plot_options(self, *args):
+        """
+        Updates plot_options after a toggle changes and marks toggled artists as outdated.
+        """
+
+        plot_options = {
+            'draw_simplices': not self.Main_Window.draw_graph.get(),
+            'draw_balls': self.Main_Window.draw_balls.get()
+        }
+
+        if plot_options != self.Main_Window.plot_options:
+            self.Main_Window.plot_options = plot_options
+            self.Main_Window.mark_dirty('artists')
+
 
 class Plot_Generation_Frame(Sidebar_Frame):
     """
@@ -957,14 +1218,19 @@ class Plot_Generation_Frame(Sidebar_Frame):
                  Main window of the app.
     Sidebar: Sidebar
              Sidebar this frame is packed upon.
-    plot_generation: register(function)
-                     Function for plot generation.
     button_generation: tb.Button
                        Button for starting the plot generation process.
-    plot_saving: register(function)
-                 Function for saving generated plot.
     button_save: tb.Button
                  Button for starting the plot saving process.
+    last_state_key: tuple or None
+                    Inputs of last calculated complex, used to skip recalculation of unchanged
+                    complex.
+    future: Future or None
+            Latest calculations submitted to the worker thread.
+    results: dict
+             Results of recent calculations by their inputs, least recently used first.
+    results_size: int
+                  Maximal number of stored results.
     """
 
     def __init__(self, root):
@@ -980,22 +1246,22 @@ class Plot_Generation_Frame(Sidebar_Frame):
         """
 
         Sidebar_Frame.__init__(self, root)
+        self.last_state_key = None
+        self.future = None
+        self.results = {}
+        self.results_size = 16
 
-        self.plot_generation = self.Main_Window.register(self.generate_plot)
         self.button_generation = tb.Button(self, 
                                            bootstyle='success', 
                                            text='Generate plot',
-                                           command=self.plot_generation)
-        self.button_generation.grid(row=0, column=0)
+                                           command=self.generate_plot)
+        self.button_generation.grid(row=0, column=0, pady=(0, 10))
 
-        self.plot_saving = self.Main_Window.register(self.save_plot)
         self.button_save = tb.Button(self, 
                                      bootstyle='primary', 
                                      text='Save plot',
-                                     command=self.plot_saving)
-        self.button_save.grid(row=0, column=1)
-
-        self.grid_hidden_separator(row=1, column=1, columnspan=2)
+                                     command=self.save_plot)
+        self.button_save.grid(row=0, column=1, pady=(0, 10))
     
     def check_input(self):
         """
@@ -1007,82 +1273,145 @@ class Plot_Generation_Frame(Sidebar_Frame):
                    If True then data is correct.
         """
 
-        dim = self.Sidebar.Dimension_Frame.entry_dimension.get()
-        dim_validated = self.Sidebar.Dimension_Frame.validate_dimension(dim)
-
         added_vertices = self.Main_Window.vertex_coords
-        if_added_vertices = len(added_vertices) > 0
+        if len(added_vertices) == 0:
+            return False
 
-        radius = self.Sidebar.Metric_Frame.entry_radius.get()
-        radius_validated = self.Sidebar.Metric_Frame.validate_radius(radius)
-
-        if dim_validated and if_added_vertices and radius_validated:
-            for vertex in added_vertices:
-                if len(vertex) != int(dim):
-                    return False
-            return True
-        else:
-            False
+        dim = self.Sidebar.Dimension_Frame.dim
+        radius = self.Sidebar.Metric_Frame.radius
 
+        return dim is not None and radius is not None and added_vertices.shape[1] == dim
 
     def generate_plot(self):
         """
-        Generates the plot and starts the process of updating plot canvas and Betti label.
+        Starts calculations of a complex in the worker thread, plot canvas and Betti label
+        are updated once they finish. Generation is skipped if the complex would not change
+        since the last generated plot. Results of recent calculations are reused without
+        calculating them again. If only radius changed, a copy of the displayed complex
+        is given the new radius, so pairwise distances are not computed again. Plot options
+        are not a part of the complex, their changes are already drawn by Main_Window.flush.
         """
 
-        radius = self.Sidebar.Metric_Frame.entry_radius.get()
-
         if self.check_input():
-            vertex_coords = self.Main_Window.convert_coords_to_float()
-
-            metric_func = self.Main_Window.metric_dict[self.Main_Window.metric]
+            metric_func = self.Main_Window.metric_func
 
-            radius = float(radius)
+            radius = self.Sidebar.Metric_Frame.radius
 
-            self.Main_Window.complex = VietorisRipsComplex(
-                vertices=vertex_coords,
-                vertex_names=self.Main_Window.vertex_names,
-                radius=radius,
-                metric=metric_func
+            state_key = (
+                self.Main_Window.vertex_coords.tobytes(),
+                self.Main_Window.vertex_coords.shape,
+                tuple(self.Main_Window.vertex_names),
+                radius,
+                metric_func
             )
-            
-            self.Main_Window.Main_Frame.Plot_Frame.update_canvas()
+            if state_key == self.last_state_key:
+                return
+            self.last_state_key = state_key
+
+            if self.future is not None:
+                self.future.cancel()
+
+            if state_key in self.results:
+                self.future = None
+                self.button_generation.config(state='normal')
+                self.results[state_key] = result = self.results.pop(state_key)
+                self.display_result(result)
+                return
+
+            vertex_coords = self.Main_Window.vertex_coords.copy()
+
+            vertex_names = list(self.Main_Window.vertex_names)
+
+            previous = self.Main_Window.complex
+            if (previous is None or previous.metric is not metric_func
+                    or previous.vertex_names != vertex_names
+                    or not np.array_equal(previous.points, vertex_coords)):
+                previous = None
+
+            def calculate():
+                if previous is not None:
+                    vr_complex = copy(previous)
+                    vr_complex.set_radius(radius)
+                else:
+                    vr_complex = VietorisRipsComplex(
+                        vertices=vertex_coords,
+                        vertex_names=vertex_names,
+                        radius=radius,
+                        metric=metric_func
+                    )
+                betti = vr_complex.get_betti()
+                return vr_complex, betti, Betti_Frame.format_betti(betti)
 
-            self.Main_Window.betti = self.Main_Window.complex.get_betti()
+            Betti_Frame = self.Main_Window.Main_Frame.Betti_Frame
 
-            self.Main_Window.Main_Frame.Betti_Frame.update_betti()
-    
-    def save_plot(self):
+            self.button_generation.config(state='disabled')
+            self.future = self.Main_Window.executor.submit(calculate)
+            self.finish_generation(self.future, state_key)
+
+    def finish_generation(self, future, state_key):
         """
-        Saves plot to app directory.
+        Waits for calculations running in the worker thread without blocking the GUI,
+        then stores their result and displays it. Results of calculations superseded
+        by newer ones are discarded. If calculations failed, their error is shown
+        in the Betti label and the same inputs can be generated again.
+
+        Arguments
+        ---------
+        future: Future
+                Calculations of a complex and its Betti numbers.
+        state_key: tuple
+                   Inputs of calculations.
         """
 
-        if self.check_input():
-            dim = self.Sidebar.Dimension_Frame.entry_dimension.get()
+        if future is not self.future:
+            return
+
+        if not future.done():
+            self.Main_Window.after(50, self.finish_generation, future, state_key)
+            return
+
+        self.future = None
+        self.button_generation.config(state='normal')
+        try:
+            result = future.result()
+        except Exception as error:
+            self.last_state_key = None
+            self.Main_Window.Main_Frame.Betti_Frame.set_text(str(error))
+            return
 
-            if int(dim) == 2:
-                draw_balls = self.Main_Window.draw_balls.get()
-                draw_simplices = not self.Main_Window.draw_graph.get()
+        self.results[state_key] = result
+        if len(self.results) > self.results_size:
+            del self.results[next(iter(self.results))]
 
-                plot_2d_complex(
-                    self.Main_Window.complex,
-                    draw_balls=draw_balls,
-                    draw_simplices=draw_simplices,
-                    save_as_file=True,
-                    return_fig=False,
-                    show_plot=False
-                )
+        self.display_result(result)
 
-            elif int(dim) == 3:
-                draw_simplices = not self.Main_Window.draw_graph.get()
+    def display_result(self, result):
+        """
+        Updates plot canvas and Betti label with calculated complex. Nothing is redrawn 
+        if the complex is already displayed.
 
-                self.Main_Window.fig, self.Main_Window.ax = plot_3d_complex(
-                    self.Main_Window.complex,
-                    draw_simplices=draw_simplices,
-                    save_as_file=True,
-                    return_fig=True,
-                    show_plot=False
-                )
+        Arguments
+        ---------
+        result: tuple
+                Complex, its Betti numbers and their text.
+        """
+
+        if result[0] is self.Main_Window.complex:
+            return
+
+        self.Main_Window.complex, self.Main_Window.betti, betti_text = result
+
+        self.Main_Window.Main_Frame.Plot_Frame.update_canvas()
+
+        self.Main_Window.Main_Frame.Betti_Frame.set_text(betti_text)
+    
+    def save_plot(self):
+        """
+        Saves displayed plot to app directory.
+        """
+
+        if self.check_input():
+            self.Main_Window.fig.savefig('plot_of_complex.png')
 
 
 class Main_Frame(tb.Frame):
@@ -1147,6 +1476,19 @@ class Plot_Frame(tb.Labelframe):
              Sidebar for getting data.
     canvas: FigureCanvasTkAgg
             Matplotlib plot embedded into app.
+    balls: list of EllipseCollection or PolyCollection or None
+           Balls drawn on the displayed 2D plot, None if they were not drawn yet.
+    simplices: list of collections or None
+               Simplices drawn on the displayed plot, None if they were not drawn yet.
+    edges: list of LineCollection
+           Edges drawn on the displayed 2D plot.
+    points: ndarray or None
+            Coordinates of vertices drawn on the displayed 2D plot, None if the plot is not 2D.
+    background: region or None
+                Copy of the rendered 2D plot without its graph, balls and simplices,
+                used for blitting them after toggles. None if it is not valid.
+    background_bbox: Bbox or None
+                     Frozen bounding box of the figure at the moment background was saved.
     """
 
     def __init__(self, root, bootstyle='default'):
@@ -1165,67 +1507,200 @@ class Plot_Frame(tb.Labelframe):
         self.Sidebar = self.Main_Window.Sidebar
         
         self.canvas = FigureCanvasTkAgg(self.Main_Window.fig, self)
-        self.canvas.draw()
+        self.canvas.draw_idle()
         self.canvas_widget = self.canvas.get_tk_widget()
         self.canvas_widget.pack(side='left', fill='both', expand=True)
+        self.balls = None
+        self.simplices = None
+        self.edges = []
+        self.points = None
+        self.background = None
+        self.background_bbox = None
+        self.canvas.mpl_connect('draw_event', self.on_draw)
     
     def update_canvas(self):
         """
-        Updates the canvas by deleting it and packing a new canvas.
+        Updates the canvas by replotting the complex on the existing figure. Axes are
+        cleared and reused, unless the plot changes between 2D and 3D. If vertices
+        of a 2D plot did not change, only its edges are replaced.
+        Simplices and balls are added by update_artists.
         """
 
-        self.Main_Window.ax.clear()
+        fig = self.Main_Window.fig
+
+        points = self.Main_Window.complex.points
+        dim = points.shape[1]
+        projection = '3d' if dim == 3 else 'rectilinear'
 
-        dim = self.Sidebar.Dimension_Frame.entry_dimension.get()
+        if (dim == 2 and self.points is not None and self.Main_Window.ax.name == projection
+                and np.array_equal(self.points, points)):
+            self.update_edges()
+            return
 
-        if int(dim) == 2:
-            draw_balls = self.Main_Window.draw_balls.get()
-            draw_simplices = not self.Main_Window.draw_graph.get()
+        if self.Main_Window.ax.name == projection:
+            self.Main_Window.ax.clear()
+        else:
+            fig.clear()
+            self.Main_Window.ax = fig.add_subplot(projection=projection)
 
-            metric = self.Main_Window.metric_dict[self.Main_Window.metric]
+        self.balls = None
+        self.simplices = None
+        self.background = None
+        self.fit_figure(fig)
 
-            self.Main_Window.fig, self.Main_Window.ax = plot_2d_complex(
+        if dim == 2:
+            plot_2d_complex(
                 self.Main_Window.complex,
-                draw_balls=draw_balls,
-                draw_simplices=draw_simplices,
-                metric=metric,
-                return_fig=True,
+                fig=fig,
+                ax=self.Main_Window.ax,
+                draw_simplices=False,
+                return_fig=False,
                 show_plot=False
             )
+            self.edges = [artist for artist in self.Main_Window.ax.collections 
+                          if isinstance(artist, LineCollection)]
 
-            self.canvas_widget.destroy()
-
-            self.canvas = FigureCanvasTkAgg(self.Main_Window.fig, self)
-            self.canvas.draw()
-            self.canvas_widget = self.canvas.get_tk_widget()
-            self.canvas_widget.pack(side='left', fill='both', expand=True)
-
-        elif int(dim) == 3:
-            draw_simplices = not self.Main_Window.draw_graph.get()
-
-            self.Main_Window.fig, self.Main_Window.ax = plot_3d_complex(
+        elif dim == 3:
+            plot_3d_complex(
                 self.Main_Window.complex,
-                draw_simplices=draw_simplices,
-                return_fig=True,
+                fig=fig,
+                ax=self.Main_Window.ax,
+                draw_simplices=False,
+                return_fig=False,
                 show_plot=False
             )
 
-            self.canvas_widget.destroy()
+        self.points = points if dim == 2 else None
+        self.update_artists()
 
-            self.canvas = FigureCanvasTkAgg(self.Main_Window.fig, self)
-            self.canvas.draw()
-            self.canvas_widget = self.canvas.get_tk_widget()
-            self.canvas_widget.pack(side='left', fill='both', expand=True)
-        
+    def update_edges(self):
+        """
+        Replaces edges, balls and simplices of the displayed 2D plot with those of the
+        current complex, keeping its vertices.
+        """
+
+        for artist in self.edges + (self.balls or []) + (self.simplices or []):
+            artist.remove()
+
+        self.balls = None
+        self.simplices = None
+        self.background = None
+        self.edges = plot_2d_edges(self.Main_Window.complex, ax=self.Main_Window.ax)
+
+        self.update_artists()
+
+    def update_artists(self):
+        """
+        Shows or hides simplices and balls on the displayed plot according to plot_options.
+        Artists are drawn once per plot when first shown, later only their visibility
+        is changed. On 2D plots they are animated together with the graph, so after
+        a toggle the plot is blitted onto the saved background of empty axes instead
+        of redrawing the whole figure.
+        """
+
+        vr_complex = self.Main_Window.complex
+        dim = vr_complex.points.shape[1]
+        plot_options = self.Main_Window.plot_options
+        fig_bbox = self.Main_Window.fig.bbox
+        blit = (dim == 2 and self.canvas.supports_blit and self.background is not None 
+                and self.background_bbox.bounds == fig_bbox.bounds)
+
+        if dim == 2 or dim == 3:
+            draw_simplices = plot_options['draw_simplices']
+            if draw_simplices and self.simplices is None:
+                plot_simplices = plot_2d_simplices if dim == 2 else plot_3d_simplices
+                self.simplices = plot_simplices(vr_complex, ax=self.Main_Window.ax)
+
+            for simplex in self.simplices or []:
+                simplex.set_visible(draw_simplices)
+
+        if dim == 2:
+            draw_balls = plot_options['draw_balls']
+            if draw_balls and self.balls is None:
+                self.balls = plot_2d_balls(vr_complex, 
+                                           ax=self.Main_Window.ax, 
+                                           metric=vr_complex.metric)
+
+            for ball in self.balls or []:
+                ball.set_visible(draw_balls)
+
+            for collection in self.Main_Window.ax.collections:
+                collection.set_animated(True)
+
+        if blit:
+            self.canvas.restore_region(self.background)
+            self.draw_animated()
+            self.canvas.blit(fig_bbox)
         else:
-            self.Main_Window.fig, self.Main_Window.ax = subplots()
+            self.set_figure(self.Main_Window.fig)
+
+    def on_draw(self, event):
+        """
+        Saves background of a freshly drawn 2D plot and draws animated artists over it.
+        Draws made by savefig are skipped, since matplotlib already includes animated
+        artists in saved figures. Background is saved together with the figure bounding
+        box, so after a resize it is not blitted until the next full draw replaces it.
+
+        Arguments
+        ---------
+        event: DrawEvent
+               Matplotlib event emitted after the figure is drawn.
+        """
+
+        if self.canvas.is_saving():
+            return
+
+        if self.Main_Window.ax.name != 'rectilinear':
+            self.background = None
+            return
+
+        self.background = self.canvas.copy_from_bbox(self.Main_Window.fig.bbox)
+        self.background_bbox = self.Main_Window.fig.bbox.frozen()
+        self.draw_animated()
+
+    def draw_animated(self):
+        """
+        Draws visible animated collections, i.e. graph, balls and simplices of a 2D plot,
+        sorted by zorder in the order they were added, as a full draw would stack them.
+        """
+
+        ax = self.Main_Window.ax
+        animated = [artist for artist in ax.collections 
+                    if artist.get_animated() and artist.get_visible()]
 
-            self.canvas_widget.destroy()
+        for artist in sorted(animated, key=lambda artist: artist.get_zorder()):
+            ax.draw_artist(artist)
 
-            self.canvas = FigureCanvasTkAgg(self.Main_Window.fig, self)
-            self.canvas.draw()
-            self.canvas_widget = self.canvas.get_tk_widget()
-            self.canvas_widget.pack(side='left', fill='both', expand=True)
+    def fit_figure(self, fig):
+        """
+        Resizes figure to the current size of the canvas, if the canvas is already shown.
+
+        Arguments
+        ---------
+        fig: figure
+             Matplotlib figure to resize.
+        """
+
+        width = self.canvas_widget.winfo_width()
+        height = self.canvas_widget.winfo_height()
+        if width > 1 and height > 1:
+            fig.set_size_inches(width / fig.dpi, height / fig.dpi, forward=False)
+
+    def set_figure(self, fig):
+        """
+        Swaps figure displayed on the canvas and schedules its redraw. Figure is resized
+        to the current size of the canvas.
+
+        Arguments
+        ---------
+        fig: figure
+             Matplotlib figure to display.
+        """
+
+        self.fit_figure(fig)
+        self.canvas.figure = fig
+        fig.set_canvas(self.canvas)
+        self.canvas.draw_idle()
 
 
 class Betti_Frame(tb.LabelFrame):
@@ -1245,6 +1720,8 @@ class Betti_Frame(tb.LabelFrame):
                  Root upon this Main_Frame is packed.
     betti_label: tb.Label
                  Displays Betti numbers of plotted simplicial complex.
+    betti_txt: str
+               Text currently displayed by betti_label.
     """
 
     def __init__(self, root, text='Betti Numbers', bootstyle='default'):
@@ -1262,25 +1739,44 @@ class Betti_Frame(tb.LabelFrame):
         tb.LabelFrame.__init__(self, root, text=text, bootstyle=bootstyle)
         self.Main_Window = root.Main_Window
 
-        self.betti_label = tb.Label(self, 
-                                    text='\u03B2_0 = 1, \u03B2_1 = 1, \u03B2_2 = 0, \u03B2_3 = 0')
+        self.betti_txt = '\u03B2_0 = 1, \u03B2_1 = 1, \u03B2_2 = 0, \u03B2_3 = 0'
+        self.betti_label = tb.Label(self, text=self.betti_txt)
         self.betti_label.config(font=('', 12))
         self.betti_label.pack()
 
-    def update_betti(self):
+    def format_betti(self, betti):
         """
-        Updates betti_label.
+        Formats Betti numbers into text of betti_label. Does not touch any widgets,
+        so it can be called from the worker thread.
+
+        Arguments
+        ---------
+        betti: list of int
+               Betti numbers of a simplicial complex.
+
+        Returns
+        -------
+        betti_txt: str
+                   Text of betti_label.
         """
 
-        betti = self.Main_Window.betti
-        
-        for i in range(len(betti)-1):
-            betti[i] = f'\u03B2_{i} = {betti[i]}, '
-        betti[-1] = f'\u03B2_{len(betti)-1} = {betti[-1]}'
+        betti_txt = ', '.join(f'\u03B2_{i} = {b}' for i, b in enumerate(betti))
+
+        return betti_txt
+
+    def set_text(self, betti_txt):
+        """
+        Updates betti_label with preformatted text, unless it is already displayed.
 
-        betti_txt = ''.join(betti)
+        Arguments
+        ---------
+        betti_txt: str
+                   Text of betti_label.
+        """
 
-        self.betti_label.config(text=betti_txt)
+        if betti_txt != self.betti_txt:
+            self.betti_txt = betti_txt
+            self.betti_label.config(text=betti_txt)
 
 
 if __name__ == '__main__':
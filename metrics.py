@@ -1,4 +1,5 @@
 import numpy as np
+from math import dist
 
 def euclidean_metric(v1, v2):
     """
@@ -17,7 +18,7 @@ def euclidean_metric(v1, v2):
               Distance between parsed vertices.
     """
 
-    return np.linalg.norm(np.array(v1) - np.array(v2))
+    return dist(v1, v2)
 
 def manhattan_metric(v1, v2):
     """
@@ -35,7 +36,7 @@ def manhattan_metric(v1, v2):
     distance: float
               Distance between parsed vertices.
     """
-    return np.linalg.norm(np.array(v1) - np.array(v2), ord=1)
+    return sum(abs(x1 - x2) for x1, x2 in zip(v1, v2, strict=True))
 
 def maximum_metric(v1, v2):
     """
@@ -53,4 +54,95 @@ def maximum_metric(v1, v2):
     distance: float
               Distance between parsed vertices.
     """
-    return np.linalg.norm(np.array(v1) - np.array(v2), ord=np.inf)
\ No newline at end of file
+    return max(abs(x1 - x2) for x1, x2 in zip(v1, v2, strict=True))
+
+def _pairwise_reduce(points, reduce, block_size=2**20):
+    """
+    Reduces absolute differences of coordinates of all pairs of points. Pairs are processed
+    in blocks of rows, so memory used by differences stays bounded. Only pairs on and above
+    the diagonal are computed, the rest is mirrored.
+
+    Arguments:
+    ----------
+    points: ndarray
+            2D array of coordinates, i-th row belongs to i-th point.
+    reduce: function
+            NumPy reduction applied along the last axis, eg. np.sum, np.max
+            or np.linalg.norm.
+    block_size: int, default=2**20
+                Maximal number of coordinate differences held at once.
+
+    Returns:
+    --------
+    distances: ndarray
+               2D array of distances between i-th and j-th point.
+    """
+
+    points = np.asarray(points, dtype=np.float64)
+    point_num, dim = points.shape
+    distances = np.empty((point_num, point_num), dtype=np.float64)
+
+    rows = max(1, block_size // max(1, point_num*dim))
+    for start in range(0, point_num, rows):
+        stop = start + rows
+        block = np.abs(points[start:stop, None, :] - points[None, start:, :])
+        distances[start:stop, start:] = reduce(block, axis=-1)
+        distances[stop:, start:stop] = distances[start:stop, stop:].T
+    return distances
+
+def euclidean_distances(points):
+    """
+    Euclidean distances between all pairs of points.
+
+    Arguments:
+    ----------
+    points: ndarray
+            2D array of coordinates, i-th row belongs to i-th point.
+
+    Returns:
+    --------
+    distances: ndarray
+               2D array of distances between i-th and j-th point.
+    """
+
+    return _pairwise_reduce(points, np.linalg.norm)
+
+def manhattan_distances(points):
+    """
+    Manhattan distances between all pairs of points.
+
+    Arguments:
+    ----------
+    points: ndarray
+            2D array of coordinates, i-th row belongs to i-th point.
+
+    Returns:
+    --------
+    distances: ndarray
+               2D array of distances between i-th and j-th point.
+    """
+
+    return _pairwise_reduce(points, np.sum)
+
+def maximum_distances(points):
+    """
+    Chebyshev distances between all pairs of points.
+
+    Arguments:
+    ----------
+    points: ndarray
+            2D array of coordinates, i-th row belongs to i-th point.
+
+    Returns:
+    --------
+    distances: ndarray
+               2D array of distances between i-th and j-th point.
+    """
+
+    return _pairwise_reduce(points, np.max)
+
+pairwise_metrics = {
+    euclidean_metric: euclidean_distances,
+    manhattan_metric: manhattan_distances,
+    maximum_metric: maximum_distances
+}
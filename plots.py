@@ -1,11 +1,14 @@
-import matplotlib.pyplot as plt
-from matplotlib.patches import Circle, Rectangle, Polygon
-from matplotlib.collections import PatchCollection
+from matplotlib.collections import EllipseCollection, LineCollection, PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.tri import Triangulation
+from mpl_toolkits.mplot3d.art3d import Line3DCollection, Poly3DCollection
 import networkx as nx
-import random
 import numpy as np
 from metrics import *
 
+_rng = np.random.default_rng()
+_RASTERIZE_SIZE = 500
+
 def plot_2d_complex(complex,
                     fig=None,
                     ax=None,
@@ -37,17 +40,19 @@ def plot_2d_complex(complex,
     Arguments
     ---------
     fig: figure or None, default=None
-         Matplotlib figure.
+         Matplotlib figure. If it has no layout engine, its layout is tightened
+         only when the plot is shown or saved. If None then a new figure is created,
+         through pyplot only if the plot is shown.
     ax: axis or None, default=None
         Axis of matplotlib figure.
     show_plot: bool, default=True
                If True shows the plot.
     fig_width: float, default=5
-               Width of a matplotlib figure.
+               Width of a created matplotlib figure.
     fig_height: float, default=5
-                Height of a matplotlib figure.
+                Height of a created matplotlib figure.
     fig_dpi: float, default=150
-             DPI of a matplotlib figure.
+             DPI of a created matplotlib figure.
     with_labels: bool, default=False
                  If True then labels are placed on vertices.
     font_size: int, default=8
@@ -88,112 +93,197 @@ def plot_2d_complex(complex,
                    share same color. If dict of dimensions p of p-simplices onto colors 
                    then simplices have color assigned by dict.
     """
-    if fig is None or ax is None:
-        fig, ax = plt.subplots()
-    fig.set_figheight(fig_width)
-    fig.set_figwidth(fig_height)
-    fig.set_dpi(fig_dpi)
-    ax.axis('equal')
-
-    nx.draw(G=complex.graph,
-            ax=ax,
-            pos=complex.vertices,
-            with_labels=with_labels,
-            font_size=font_size,
-            node_size=vertex_size,
-            node_color=vertex_interior_color,
-            edge_color=vertex_border_color,
-            edgecolors=edge_color)
+    if (fig is None or ax is None) and not show_plot:
+        fig = Figure(figsize=(fig_width, fig_height), dpi=fig_dpi, layout='tight')
+        ax = fig.add_subplot()
+    elif fig is None or ax is None:
+        import matplotlib.pyplot as plt
+        fig, ax = plt.subplots(figsize=(fig_width, fig_height), dpi=fig_dpi, layout='tight')
+
+    nx.draw_networkx_nodes(complex.graph,
+                           pos=complex.vertices,
+                           ax=ax,
+                           node_size=vertex_size,
+                           node_color=vertex_interior_color,
+                           edgecolors=edge_color)
+    plot_2d_edges(complex, ax=ax, edge_color=vertex_border_color)
+    if with_labels:
+        nx.draw_networkx_labels(complex.graph,
+                                pos=complex.vertices,
+                                ax=ax,
+                                font_size=font_size)
+    ax.set_axis_off()
     
     if draw_balls:
-        if metric == euclidean_metric:
-            for vertex in complex.vertices.values():
-                if ball_color is None:
-                    color = [random.random() for _ in range(3)]
-                else:
-                    color = ball_color
-
-                ball = Circle(vertex,
-                              radius=complex.radius,
-                              alpha=ball_alpha,
-                              edgecolor=None,
-                              facecolor=color,
-                              zorder=-1)
-
-                ax.add_artist(ball)
-
-        if metric == manhattan_metric:
-            for vertex in complex.vertices.values():
-                if ball_color is None:
-                    color = [random.random() for _ in range(3)]
-                else:
-                    color = ball_color
-
-                ball_anchor = np.array(vertex) - np.array([0, complex.radius])
-                edge_length = euclidean_metric([-complex.radius,0], [0,-complex.radius])
-                ball = Rectangle(ball_anchor, 
-                                 edge_length, 
-                                 edge_length,
-                                 angle=45,
-                                 alpha=ball_alpha,
-                                 edgecolor=None,
-                                 facecolor=color,
-                                 zorder=-1)
-
-                ax.add_artist(ball)
-
-        if metric == maximum_metric:
-            for vertex in complex.vertices.values():
-                if ball_color is None:
-                    color = [random.random() for _ in range(3)]
-                else:
-                    color = ball_color
-
-                ball_anchor = np.array(vertex) - np.array([complex.radius, complex.radius])
-                ball = Rectangle(ball_anchor, 
-                                 2*complex.radius, 
-                                 2*complex.radius,
-                                 alpha=ball_alpha,
-                                 edgecolor=None,
-                                 facecolor=color,
-                                 zorder=-1)
-
-                ax.add_artist(ball)
+        plot_2d_balls(complex,
+                      ax=ax,
+                      metric=metric,
+                      ball_alpha=ball_alpha,
+                      ball_color=ball_color)
     
     if draw_simplices:
-        simplices = [simplex for simplex in complex.get_all_simplices() if len(simplex) > 2]
-
-        for dim in range(2, complex.dim+1):
-            p_simplices = [simplex for simplex in simplices if len(simplex) == dim+1]
-            polygons = []
-
-            for simplex in p_simplices:
-                vertices = [complex.vertices[vertex] for vertex in simplex]
-                polygons.append(Polygon(vertices, closed=True, ))
-            
-            patches = PatchCollection(polygons)
-
-            if simplex_color is None:
-                patches.set_color([random.random() for _ in range(3)])
-            elif isinstance(simplex_color, dict):
-                patches.set_color(simplex_color[dim])
-            else:
-                patches.set_color(simplex_color)
-            
-            patches.set_zorder(-1)
-            patches.set_alpha(simplex_alpha)
-            
-            ax.add_collection(patches)
-
-    plt.tight_layout()
+        plot_2d_simplices(complex,
+                          ax=ax,
+                          simplex_alpha=simplex_alpha,
+                          simplex_color=simplex_color)
+
+    ax.set_aspect('equal', adjustable='datalim')
+
+    if (save_as_file or show_plot) and fig.get_layout_engine() is None:
+        fig.tight_layout()
 
     if save_as_file:
-        plt.savefig(f'{file_directory}{file_name}.{file_extension}')
+        fig.savefig(f'{file_directory}{file_name}.{file_extension}')
     if show_plot:
+        import matplotlib.pyplot as plt
         plt.show()
     if return_fig:
         return fig, ax
     
+def plot_2d_edges(complex,
+                  ax,
+                  edge_color='#000'):
+    """
+    Draws edges of a simplicial complex on a 2D plot, without its vertices.
+    Also used for replacing edges of a plot, whose vertices did not change.
+
+    Arguments
+    ---------
+    ax: axis
+        Axis of matplotlib figure.
+    edge_color: str or list of float, default='#000'
+                Color of edges of a simplicial complex.
+
+    Returns
+    -------
+    edges: list of LineCollection
+           Collection of drawn edges, empty if complex has no edges.
+    """
+
+    edges = nx.draw_networkx_edges(complex.graph,
+                                   pos=complex.vertices,
+                                   ax=ax,
+                                   edge_color=edge_color)
+
+    return [edges] if isinstance(edges, LineCollection) else []
+
+def plot_2d_balls(complex,
+                  ax,
+                  metric=euclidean_metric,
+                  ball_alpha=0.2,
+                  ball_color=None):
+    """
+    Draws balls of radius of a simplicial complex around its vertices on a 2D plot.
+    Balls are gathered into a single collection built from coordinates of all vertices
+    at once, so they are drawn as one artist. Large collections are rasterized in 
+    vector outputs.
+
+    Arguments
+    ---------
+    ax: axis
+        Axis of matplotlib figure.
+    metric: function, default=euclidean_metric
+            Metric used to measure distance from center of balls.
+    ball_alpha: float, default=0.2
+                Value corresponding to transparency of balls.
+    ball_color: None or float, default=None
+                Color of balls. If None then color is randomized.
+
+    Returns
+    -------
+    balls: list of EllipseCollection or PolyCollection
+           Collection of drawn balls.
+    """
+
+    points = complex.points
+    radius = complex.radius
+
+    if ball_color is None:
+        colors = _rng.random((len(points), 3))
+    else:
+        colors = ball_color
+
+    corners = None
+    if metric == manhattan_metric:
+        corners = np.array([[0, -radius], [radius, 0], [0, radius], [-radius, 0]])
+    if metric == maximum_metric:
+        corners = np.array([[-radius, -radius], [radius, -radius], 
+                            [radius, radius], [-radius, radius]])
+
+    if metric == euclidean_metric:
+        balls = EllipseCollection(2*radius,
+                                  2*radius,
+                                  0,
+                                  units='xy',
+                                  offsets=points,
+                                  offset_transform=ax.transData,
+                                  facecolors=colors,
+                                  edgecolors='none',
+                                  alpha=ball_alpha,
+                                  zorder=-1)
+    else:
+        balls = PolyCollection([] if corners is None else points[:, None, :] + corners,
+                               facecolors=colors,
+                               edgecolors='none',
+                               alpha=ball_alpha,
+                               zorder=-1)
+    balls.set_rasterized(len(points) > _RASTERIZE_SIZE)
+    ax.add_collection(balls, autolim=False)
+
+    return [balls]
+
+def plot_2d_simplices(complex,
+                      ax,
+                      simplex_alpha=0.2,
+                      simplex_color=None):
+    """
+    Draws simplices of dimension 2 and higher of a simplicial complex on a 2D plot.
+    Simplices of the same dimension are drawn as one collection of polygons.
+    Large collections are rasterized in vector outputs.
+
+    Arguments
+    ---------
+    ax: axis
+        Axis of matplotlib figure.
+    simplex_alpha: float, default=0.2
+                   Value corresponding to transparency of simplices.
+    simplex_color: None or float or dict of int into float
+                   Color of simplices. If None then colors of simplices are randomized 
+                   and grouped into respective dimensions. If float then all simplices 
+                   share same color. If dict of dimensions p of p-simplices onto colors 
+                   then simplices have color assigned by dict.
+
+    Returns
+    -------
+    collections: list of PolyCollection
+                 Drawn simplices grouped by dimension.
+    """
+
+    collections = []
+
+    for dim in range(2, complex.dim+1):
+        p_simplices = complex.get_p_simplices(dim)
+        indices = np.array([[complex.vertex_ids[vertex] for vertex in simplex]
+                            for simplex in p_simplices], dtype=np.intp).reshape(-1, dim+1)
+
+        if simplex_color is None:
+            color = _rng.random(3)
+        elif isinstance(simplex_color, dict):
+            color = simplex_color[dim]
+        else:
+            color = simplex_color
+
+        polygons = PolyCollection(complex.points[indices],
+                                  color=color,
+                                  alpha=simplex_alpha,
+                                  zorder=-1)
+        
+        polygons.set_rasterized(len(p_simplices) > _RASTERIZE_SIZE)
+        ax.add_collection(polygons)
+        collections.append(polygons)
+
+    return collections
+
 def plot_3d_complex(complex,
                     fig=None,
                     ax=None,
@@ -217,17 +307,18 @@ def plot_3d_complex(complex,
     Arguments
     ---------
     fig: figure or None, default=None
-         Matplotlib figure.
+         Matplotlib figure. If None then a new figure is created, through pyplot only 
+         if the plot is shown.
     ax: axis or None, default=None
         Axis of matplotlib figure.
     show_plot: bool, default=True
                If True shows the plot.
     fig_width: float, default=5
-               Width of a matplotlib figure.
+               Width of a created matplotlib figure.
     fig_height: float, default=5
-                Height of a matplotlib figure.
+                Height of a created matplotlib figure.
     fig_dpi: float, default=150
-             DPI of a matplotlib figure.
+             DPI of a created matplotlib figure.
     vertex_color: str or list of float, default='#000'
                   Color of vertices.
     edge_color: str or list of float, default='#000'
@@ -253,58 +344,110 @@ def plot_3d_complex(complex,
                    then simplices have color assigned by dict.
     """
 
-    if fig is None or ax is None:
-        fig = plt.figure()
+    if (fig is None or ax is None) and not show_plot:
+        fig = Figure(figsize=(fig_width, fig_height), dpi=fig_dpi)
         ax = fig.add_subplot(projection='3d')
-    fig.set_figheight(fig_width)
-    fig.set_figwidth(fig_height)
-    fig.set_dpi(fig_dpi)
-    ax.axis('equal')
-
-    vertex_coords = list(complex.vertices.values())
-
-    vertex_coords = np.array(vertex_coords)
-    v_x = vertex_coords[:, 0]
-    v_y = vertex_coords[:, 1]
-    v_z = vertex_coords[:, 2]
-    ax.scatter3D(v_x, v_y, v_z, color=vertex_color)
-
-    edges = np.array(complex.graph.edges)
-    for vertex_1, vertex_2 in edges:
-        v1_x, v1_y, v1_z = complex.vertices[vertex_1]
-        v2_x, v2_y, v2_z = complex.vertices[vertex_2]
-        ax.plot([v1_x, v2_x], [v1_y, v2_y], [v1_z, v2_z], color=edge_color)
+    elif fig is None or ax is None:
+        import matplotlib.pyplot as plt
+        fig = plt.figure(figsize=(fig_width, fig_height), dpi=fig_dpi)
+        ax = fig.add_subplot(projection='3d')
+
+    points = complex.points
+    ax.scatter3D(points[:, 0], points[:, 1], points[:, 2], color=vertex_color)
+
+    edges = np.array([(complex.vertex_ids[vertex_1], complex.vertex_ids[vertex_2])
+                      for vertex_1, vertex_2 in complex.graph.edges], dtype=np.intp)
+    segments = points[edges.reshape(-1, 2)]
+    ax.add_collection3d(Line3DCollection(segments, colors=edge_color), autolim=False)
     
-    ax.set_xlim((min(v_x)-0.1, max(v_x)+0.1))
-    ax.set_ylim((min(v_y)-0.1, max(v_y)+0.1))
-    ax.set_zlim((min(v_z)-0.1, max(v_z)+0.1))
+    lower = points.min(axis=0) - 0.1
+    upper = points.max(axis=0) + 0.1
+    ax.set_xlim((lower[0], upper[0]))
+    ax.set_ylim((lower[1], upper[1]))
+    ax.set_zlim((lower[2], upper[2]))
 
     if draw_simplices:
-        simplices = [simplex for simplex in complex.simplices if len(simplex) > 2]
-
-        for dim in range(2, complex.dim+1):
-            p_simplices = [simplex for simplex in simplices if len(simplex) == dim+1]
-            p_simplices_coords = [[complex.vertices[vertex] for vertex in simplex] for simplex in p_simplices]
-
-            if simplex_color is None:
-                color = [random.random() for _ in range(3)]
-            
-            for p_simplex in p_simplices_coords:
-                p_simplex = np.array(p_simplex)
-                s_x = p_simplex[:, 0]
-                s_y = p_simplex[:, 1]
-                s_z = p_simplex[:, 2]
-
-                if simplex_color is None:
-                    ax.plot_trisurf(s_x, s_y, s_z, color=color, alpha=simplex_alpha)
-                elif isinstance(simplex_color, dict):
-                    ax.plot_trisurf(s_x, s_y, s_z, color=simplex_color[dim], alpha=simplex_alpha)
-                else:
-                    ax.plot_trisurf(s_x, s_y, s_z, color=simplex_color, alpha=simplex_alpha)
+        plot_3d_simplices(complex,
+                          ax=ax,
+                          simplex_alpha=simplex_alpha,
+                          simplex_color=simplex_color)
 
     if save_as_file:
-        plt.savefig(f'{file_directory}{file_name}.{file_extension}')
+        fig.savefig(f'{file_directory}{file_name}.{file_extension}')
     if show_plot:
+        import matplotlib.pyplot as plt
         plt.show()
     if return_fig:
-        return fig, ax
\ No newline at end of file
+        return fig, ax
+
+def plot_3d_simplices(complex,
+                      ax,
+                      simplex_alpha=0.2,
+                      simplex_color=None):
+    """
+    Draws maximal simplices of dimension 2 and higher of a simplicial complex on a 3D plot.
+    Simplices are triangulated as by plot_trisurf and triangles of simplices of the same 
+    dimension are gathered into a single collection. Triangles are taken directly from
+    coordinates of 2-simplices, only higher simplices need a triangulation each.
+    Large collections are rasterized in vector outputs.
+
+    Arguments
+    ---------
+    ax: axis
+        3D axis of matplotlib figure.
+    simplex_alpha: float, default=0.2
+                   Value corresponding to transparency of simplices.
+    simplex_color: None or float or dict of int into float
+                   Color of simplices. If None then colors of simplices are randomized 
+                   and grouped into respective dimensions. If float then all simplices 
+                   share same color. If dict of dimensions p of p-simplices onto colors 
+                   then simplices have color assigned by dict.
+
+    Returns
+    -------
+    surfaces: list of Poly3DCollection
+              Drawn simplices grouped by dimension.
+    """
+
+    surfaces = []
+    simplices = {}
+    for simplex in complex.simplices:
+        if len(simplex) > 2:
+            simplices.setdefault(len(simplex)-1, []).append(simplex)
+
+    for dim in range(2, complex.dim+1):
+        p_simplices = simplices.get(dim)
+        if not p_simplices:
+            continue
+
+        indices = np.array([[complex.vertex_ids[vertex] for vertex in simplex] 
+                            for simplex in p_simplices], dtype=np.intp)
+
+        if dim == 2:
+            triangles = complex.points[indices]
+            sides = triangles[:, 1:, :2] - triangles[:, :1, :2]
+            clockwise = sides[:, 0, 0]*sides[:, 1, 1] - sides[:, 0, 1]*sides[:, 1, 0] < 0
+            triangles[clockwise] = triangles[clockwise][:, [0, 2, 1]]
+        else:
+            triangles = []
+            for p_simplex in complex.points[indices]:
+                triangulation = Triangulation(p_simplex[:, 0], p_simplex[:, 1])
+                triangles.append(p_simplex[triangulation.get_masked_triangles()])
+            triangles = np.concatenate(triangles)
+
+        if simplex_color is None:
+            color = _rng.random(3)
+        elif isinstance(simplex_color, dict):
+            color = simplex_color[dim]
+        else:
+            color = simplex_color
+
+        surface = Poly3DCollection(triangles, 
+                                   facecolors=color, 
+                                   alpha=simplex_alpha, 
+                                   shade=True)
+        surface.set_rasterized(len(triangles) > _RASTERIZE_SIZE)
+        ax.add_collection3d(surface, autolim=False)
+        surfaces.append(surface)
+
+    return surfaces